@@ -1,34 +1,168 @@
+import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import backtrader as bt
 from datetime import datetime
 
+
+@lru_cache(maxsize=32)
+def _load_ohlcv(data_dir, cache_dir, symbol, timeframe):
+    """CSV를 읽어 DataFrame으로 반환합니다 (디스크 Parquet 캐시 + 프로세스 내 LRU).
+
+    최초 로드시 Parquet 사본을 만들어 두고, CSV보다 캐시가 최신이면
+    Parquet에서 읽어 CSV/날짜 파싱 비용을 건너뜁니다. 같은 프로세스에서의
+    반복 호출은 lru_cache로 디스크 접근 자체를 생략합니다.
+    """
+    filepath = f"{data_dir}/{symbol}_{timeframe}.csv"
+    cache_path = f"{cache_dir}/{symbol}_{timeframe}.parquet"
+
+    try:
+        if (os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(filepath)):
+            return pd.read_parquet(cache_path)
+    except Exception:
+        pass  # 캐시 손상/엔진 미설치 등은 CSV 경로로 폴백
+
+    try:
+        df = pd.read_csv(
+            filepath,
+            index_col='timestamp',
+            parse_dates=True
+        )
+    except FileNotFoundError:
+        print(f"Error: Data file not found at {filepath}")
+        raise
+
+    # 인덱스가 단조 증가해야 .loc 슬라이스가 이진 탐색(O(log N)) 경로를 탐
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_parquet(cache_path, compression='zstd')
+    except Exception:
+        pass  # pyarrow 미설치 등 - 캐시 없이 진행
+
+    return df
+
+
+@lru_cache(maxsize=32)
+def _load_df(data_dir, cache_dir, symbol, timeframe, start_iso, end_iso):
+    """기간 슬라이스까지 끝난 DataFrame을 반환합니다 (모듈 레벨 LRU).
+
+    DataFactory가 그리드 조합마다 새로 만들어지더라도 같은
+    (심볼, 타임프레임, 기간) 키의 파싱+슬라이스는 프로세스당 한 번만 수행됩니다.
+    키는 해시 가능하도록 ISO 문자열만 받습니다.
+    """
+    df = _load_ohlcv(data_dir, cache_dir, symbol, timeframe)
+    df = df.loc[pd.Timestamp(start_iso):pd.Timestamp(end_iso)]
+
+    if df.empty:
+        raise ValueError("No data available for the specified date range.")
+
+    return df
+
+
+def df_to_arrays(df):
+    """DataFrame을 NumpyArrayData용 SoA float64 배열 6개 튜플로 변환합니다.
+
+    반환: (datetime, open, high, low, close, volume). datetime 변환의
+    파이썬 루프가 O(N)이므로, 같은 데이터로 피드를 여러 번 만들 때는
+    이 변환을 한 번만 하고 NumpyArrayData(arrays=...)에 구간 뷰를 넘기면
+    피드 생성이 O(1)이 됩니다.
+    """
+    # 컬럼명은 PandasData처럼 대소문자 구분 없이 매칭
+    cols = {c.lower(): c for c in df.columns}
+    arr_datetime = np.ascontiguousarray(
+        [bt.date2num(dt) for dt in df.index.to_pydatetime()], dtype=np.float64)
+    if 'volume' in cols:
+        arr_volume = np.ascontiguousarray(
+            df[cols['volume']].values, dtype=np.float64)
+    else:
+        arr_volume = np.zeros(len(df), dtype=np.float64)
+    return (
+        arr_datetime,
+        np.ascontiguousarray(df[cols['open']].values, dtype=np.float64),
+        np.ascontiguousarray(df[cols['high']].values, dtype=np.float64),
+        np.ascontiguousarray(df[cols['low']].values, dtype=np.float64),
+        np.ascontiguousarray(df[cols['close']].values, dtype=np.float64),
+        arr_volume,
+    )
+
+
+class NumpyArrayData(bt.feed.DataBase):
+    """미리 NumPy 배열로 변환해 둔 OHLCV를 공급하는 인메모리 피드.
+
+    PandasData는 매 바마다 파이썬 레벨에서 DataFrame을 조회하지만,
+    이 피드는 컬럼별 연속(contiguous) float64 배열을 한 번만 만들어 두고
+    _load에서 인덱스 접근만 수행합니다. optstrategy처럼 같은 데이터를
+    파라미터 조합마다 재사용하는 경우 바 반복 오버헤드가 크게 줄어듭니다.
+    """
+
+    params = (
+        ('df', None),  # DatetimeIndex + open/high/low/close/volume 컬럼의 DataFrame
+        # 이미 변환된 (datetime, open, high, low, close, volume) float64 배열
+        # 6개 튜플 - 공유 메모리에 올려 둔 배열을 복사 없이 재사용할 때 사용
+        ('arrays', None),
+    )
+
+    def __init__(self):
+        if self.p.arrays is not None:
+            (self._arr_datetime, self._arr_open, self._arr_high,
+             self._arr_low, self._arr_close, self._arr_volume) = self.p.arrays
+            self._rows = len(self._arr_datetime)
+            self._idx = 0
+            return
+
+        df = self.p.df
+        if df is None:
+            raise ValueError("NumpyArrayData requires a 'df' or 'arrays' parameter.")
+
+        # 컬럼 지향(SoA) 배열로 변환 - 캐시 친화적이고 바당 pandas 조회가 없음
+        (self._arr_datetime, self._arr_open, self._arr_high,
+         self._arr_low, self._arr_close, self._arr_volume) = df_to_arrays(df)
+        self._rows = len(df)
+        self._idx = 0
+
+    def start(self):
+        super().start()
+        # 여러 Cerebro 실행에서 재사용될 수 있으므로 커서를 리셋
+        self._idx = 0
+
+    def _load(self):
+        idx = self._idx
+        if idx >= self._rows:
+            return False
+
+        self.lines.datetime[0] = self._arr_datetime[idx]
+        self.lines.open[0] = self._arr_open[idx]
+        self.lines.high[0] = self._arr_high[idx]
+        self.lines.low[0] = self._arr_low[idx]
+        self.lines.close[0] = self._arr_close[idx]
+        self.lines.volume[0] = self._arr_volume[idx]
+        self.lines.openinterest[0] = 0.0
+
+        self._idx = idx + 1
+        return True
+
+
 class DataFactory:
-    def __init__(self, data_dir='data/ohlcv'):
+    def __init__(self, data_dir='data/ohlcv', cache_dir='data/cache'):
         self.data_dir = data_dir
+        self.cache_dir = cache_dir
 
     def get_data_feed(self, symbol, timeframe, start_date, end_date):
         """
         CSV 파일에서 데이터를 로드하여 Backtrader 데이터 피드로 변환합니다.
         """
-        filepath = f"{self.data_dir}/{symbol}_{timeframe}.csv"
-        try:
-            df = pd.read_csv(
-                filepath,
-                index_col='timestamp',
-                parse_dates=True
-            )
-        except FileNotFoundError:
-            print(f"Error: Data file not found at {filepath}")
-            raise
-
-        # 날짜 필터링
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date)
-        df = df.loc[start_dt:end_dt]
-
-        if df.empty:
-            raise ValueError("No data available for the specified date range.")
-
-        # Backtrader의 PandasData 피드로 변환
-        data_feed = bt.feeds.PandasData(dataname=df)
-        return data_feed
\ No newline at end of file
+        # 캐시 키는 해시 가능해야 하므로 날짜를 ISO 문자열로 정규화
+        start_iso = str(start_date)
+        end_iso = str(end_date)
+        df = _load_df(self.data_dir, self.cache_dir,
+                      symbol, timeframe, start_iso, end_iso)
+
+        # 배열 기반 인메모리 피드로 변환 (최적화 실행 간 공유/재사용 가능)
+        data_feed = NumpyArrayData(df=df)
+        return data_feed
@@ -1,11 +1,30 @@
+import os
+
+import numpy as np
 import backtrader as bt
 
 class BacktestEngine:
-    def __init__(self, config):
+    def __init__(self, config, maxcpus=None):
         self.config = config
-        self.cerebro = bt.Cerebro()
+        # 최적화(optstrategy) 시 코어 수만큼 워커를 띄우고,
+        # optreturn=True로 전략 인스턴스 대신 경량 OptReturn 객체만 돌려받음.
+        # stdstats=False: Broker/BuySell/Trades 옵저버의 바당 갱신 제거
+        #   (결과는 분석기에서만 읽으므로 순수 오버헤드)
+        # preload/runonce=True: 데이터 선적재 + 지표 일괄(벡터) 계산 경로 사용
+        # ※ 차트가 필요한 실행은 stdstats=True로 다시 돌려야 매매 마커가 보임
+        self.maxcpus = maxcpus if maxcpus is not None else os.cpu_count()
+        # exactbars>0은 라인 버퍼를 최소 길이로만 유지해 O(N) 메모리를 O(1)로
+        # 줄이지만, backtrader가 preload/runonce(및 전략의 배열 기반 신호
+        # 사전계산)를 무효화하므로 RAM이 부족한 초대형 피드에서만 켤 것
+        exactbars = (config.get('optimization') or {}).get('exactbars', 0)
+        self.cerebro = bt.Cerebro(maxcpus=self.maxcpus, optreturn=True,
+                                  stdstats=False, preload=True, runonce=True,
+                                  exactbars=exactbars)
+        self._data_feeds = []
 
     def add_data(self, data_feed):
+        # 베이지안 탐색 등에서 Cerebro를 다시 만들 때 재사용할 수 있도록 보관
+        self._data_feeds.append(data_feed)
         self.cerebro.adddata(data_feed)
 
     def add_strategy(self, strategy_class, params):
@@ -17,6 +36,102 @@ class BacktestEngine:
                       for k, v in params_to_optimize.items()}
         self.cerebro.optstrategy(strategy_class, **opt_params)
 
+    def run_vectorized(self, strategy_class, params, close=None):
+        """전략이 벡터화 구현을 제공하면 Cerebro 없이 단일 패스로 실행합니다.
+
+        strategy_class.vectorized_impl 에 vector_backtest 모듈의 함수명을
+        지정한 전략만 지원합니다. close를 생략하면 add_data로 추가된 첫 번째
+        NumpyArrayData 피드의 close 배열을 사용합니다.
+        """
+        impl_name = getattr(strategy_class, 'vectorized_impl', None)
+        if not impl_name:
+            raise TypeError(
+                f"{strategy_class.__name__} has no vectorized implementation")
+
+        from . import vector_backtest
+        impl = getattr(vector_backtest, impl_name)
+
+        if close is None:
+            close = self._data_feeds[0]._arr_close
+
+        common = self.config['common']
+        analysis = impl(close, params,
+                        cash=common['initial_cash'],
+                        commission=common['commission'])
+        analysis['params'] = dict(params)
+        return analysis
+
+    def run_bayesian(self, strategy_class, params_to_optimize,
+                     n_trials=50, patience=10):
+        """Optuna TPE 기반 베이지안 탐색으로 파라미터를 최적화합니다.
+
+        전수 그리드(optstrategy) 대신 유망한 조합만 제안받아 백테스트하므로
+        파라미터가 5개 이상인 그리드에서도 훨씬 적은 실행 횟수로 수렴합니다.
+        patience 회 연속으로 최고 기록이 갱신되지 않으면 조기 종료합니다.
+
+        params_to_optimize 값 형식:
+          - [start, stop, step] 숫자 3개: 정수/실수 범위로 해석 (그리드 설정과 동일)
+          - 그 외 리스트: 후보값 목록(categorical)
+          - 스칼라: 고정값
+
+        반환: analyze_results 형식의 dict 리스트 ('params' 포함, 목표값 내림차순).
+        기존 add_optimizer/run 그리드 경로는 그대로 유지됩니다.
+        """
+        import optuna
+
+        target = self.config['optimization']['optimize_target']
+        space = list(params_to_optimize.items())
+
+        def _suggest(trial):
+            params = {}
+            for name, spec in space:
+                if (isinstance(spec, (list, tuple)) and len(spec) == 3
+                        and all(isinstance(v, (int, float)) for v in spec)):
+                    lo, hi, step = spec
+                    if all(float(v).is_integer() for v in spec):
+                        params[name] = trial.suggest_int(
+                            name, int(lo), int(hi), step=int(step))
+                    else:
+                        params[name] = trial.suggest_float(name, lo, hi, step=step)
+                elif isinstance(spec, (list, tuple)):
+                    params[name] = trial.suggest_categorical(name, list(spec))
+                else:
+                    params[name] = spec
+            return params
+
+        def objective(trial):
+            params = _suggest(trial)
+            # 매 trial마다 새 Cerebro로 단일 백테스트 실행 (데이터 피드는 재사용)
+            engine = BacktestEngine(self.config, maxcpus=1)
+            for feed in self._data_feeds:
+                engine.add_data(feed)
+            engine.add_strategy(strategy_class, params)
+            result = engine.run()
+            analysis = engine.analyze_results(result[0])
+            analysis['params'] = params
+            trial.set_user_attr('analysis', analysis)
+            return analysis.get(target) or 0.0
+
+        state = {'best': None, 'stale': 0}
+
+        def _early_stop(study, trial):
+            best = study.best_value
+            if state['best'] is None or best > state['best']:
+                state['best'] = best
+                state['stale'] = 0
+            else:
+                state['stale'] += 1
+                if state['stale'] >= patience:
+                    study.stop()
+
+        study = optuna.create_study(direction='maximize')
+        study.optimize(objective, n_trials=n_trials, callbacks=[_early_stop])
+
+        results = [t.user_attrs['analysis'] for t in study.trials
+                   if 'analysis' in t.user_attrs]
+        results.sort(key=lambda a: a.get(target) or 0, reverse=True)
+        return results
+
     def run(self):
         """단순 백테스트 또는 최적화를 실행합니다."""
         common_cfg = self.config['common']
@@ -36,28 +151,23 @@ class BacktestEngine:
         return results
 
     def analyze_results(self, strategy_result):
-        """실행된 전략의 결과를 분석하고 딕셔너리로 반환합니다."""
+        """실행된 전략의 결과를 분석하고 딕셔너리로 반환합니다.
+
+        일반 백테스트의 전략 인스턴스와 optreturn=True 최적화가 돌려주는
+        OptReturn 객체(analyzers/params만 보유, broker 없음)를 모두 처리합니다.
+        """
         analyzers = strategy_result.analyzers
-        
-        # ✅ 수정: 최적화와 일반 백테스트 모두 처리
+        initial_cash = self.config['common']['initial_cash']
+
         if hasattr(strategy_result, 'broker'):
-            # 일반 백테스트
+            # 일반 백테스트: broker에서 직접 읽음
             final_value = strategy_result.broker.getvalue()
         else:
-            # 최적화 실행 - analyzers에서 final value 추출
+            # OptReturn: 워커 프로세스에서 실행돼 broker가 없으므로
+            # Returns 분석기의 rtot(총 수익률)로 final_value를 복원
             returns_analysis = analyzers.returns.get_analysis()
-            
-            # rtot (총 수익률)을 사용해서 final_value 계산
-            if 'rtot' in returns_analysis:
-                rtot = returns_analysis['rtot']  # 예: -0.0134 = -1.34%
-                final_value = 1000 * (1 + rtot)  # initial_cash 대신 1000 사용
-                print(f"✅ rtot {rtot:.4f} 사용하여 final_value 계산: {final_value:.2f}")
-            else:
-                # 기본값 사용
-                final_value = 1000
-                print(f"⚠️ Returns 분석기에서 rtot을 찾을 수 없음. 기본값 {final_value} 사용")
-        
-        initial_cash = self.config['common']['initial_cash']
+            rtot = returns_analysis.get('rtot', 0.0)
+            final_value = initial_cash * (1 + rtot)
 
         # 각 분석기에서 결과 추출
         sharpe = analyzers.sharpe_ratio.get_analysis()
@@ -65,14 +175,18 @@ class BacktestEngine:
         returns = analyzers.returns.get_analysis()
         trade_info = analyzers.trade_analyzer.get_analysis()
 
+        # 중첩 .get 체인은 서브딕셔너리를 한 번만 꺼내 재사용
+        won_info = trade_info.get('won', {})
+        lost_info = trade_info.get('lost', {})
+
         # 승률 계산
         total_trades = trade_info.get('total', {}).get('total', 0)
-        won_trades = trade_info.get('won', {}).get('total', 0)
-        win_rate_pct = (won_trades / total_trades * 100) if total_trades > 0 else 0
+        won_trades = won_info.get('total', 0)
+        win_rate_pct = (won_trades / total_trades * 100) if total_trades else 0.0
 
         # Profit Factor 계산
-        gross_profit = trade_info.get('won', {}).get('pnl', {}).get('total', 0)
-        gross_loss = abs(trade_info.get('lost', {}).get('pnl', {}).get('total', 0))
+        gross_profit = won_info.get('pnl', {}).get('total', 0)
+        gross_loss = abs(lost_info.get('pnl', {}).get('total', 0))
         profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else 0
 
         analysis = {
@@ -90,10 +204,69 @@ class BacktestEngine:
         }
         return analysis
 
+    def analyze_results_batch(self, strategy_results):
+        """여러 실행 결과를 한 번에 분석해 dict 리스트로 반환합니다.
+
+        analyze_results를 조합마다 호출하면 공통 설정 조회와 수익률 계산이
+        조합 수만큼 반복되므로, 불변 값(심볼/기간/초기 자본)은 한 번만 읽고
+        최종 자산 -> 수익률 변환은 NumPy 배열 연산 한 번으로 처리합니다.
+        backtrader 분석기는 거래별 배열을 노출하지 않아 분석기 딕셔너리
+        조회는 실행당 한 번씩 남습니다.
+        """
+        common = self.config['common']
+        initial_cash = common['initial_cash']
+        symbol = common['symbol']
+        timeframe = common['timeframe']
+        period = f"{common['start_date']} ~ {common['end_date']}"
+
+        n = len(strategy_results)
+        final_values = np.empty(n, dtype=np.float64)
+        rows = []
+        for i, strategy_result in enumerate(strategy_results):
+            analyzers = strategy_result.analyzers
+
+            if hasattr(strategy_result, 'broker'):
+                final_values[i] = strategy_result.broker.getvalue()
+            else:
+                rtot = analyzers.returns.get_analysis().get('rtot', 0.0)
+                final_values[i] = initial_cash * (1 + rtot)
+
+            sharpe = analyzers.sharpe_ratio.get_analysis()
+            drawdown = analyzers.drawdown.get_analysis()
+            trade_info = analyzers.trade_analyzer.get_analysis()
+            won_info = trade_info.get('won', {})
+            lost_info = trade_info.get('lost', {})
+
+            total_trades = trade_info.get('total', {}).get('total', 0)
+            won_trades = won_info.get('total', 0)
+            gross_profit = won_info.get('pnl', {}).get('total', 0)
+            gross_loss = abs(lost_info.get('pnl', {}).get('total', 0))
+
+            rows.append({
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'period': period,
+                'initial_value': initial_cash,
+                'sharpe_ratio': sharpe.get('sharperatio', 0),
+                'max_drawdown_pct': drawdown.get('max', {}).get('drawdown', 0),
+                'total_trades': total_trades,
+                'win_rate_pct': (won_trades / total_trades * 100)
+                                if total_trades else 0.0,
+                'profit_factor': (gross_profit / gross_loss)
+                                 if gross_loss > 0 else 0,
+            })
+
+        total_return_pct = (final_values / initial_cash - 1.0) * 100.0
+        for i, row in enumerate(rows):
+            row['final_value'] = float(final_values[i])
+            row['total_return_pct'] = float(total_return_pct[i])
+        return rows
+
     def plot(self, plot_path=None):
-        """결과 차트를 그리고, 지정된 경로에 저장합니다."""
-        fig = self.cerebro.plot(style='candlestick', barup='green', bardown='red')[0][0]
-        if plot_path:
-            fig.savefig(plot_path, dpi=300)
-            print(f"Plot saved to {plot_path}")
-        # plt.show() # 로컬에서 바로 보고 싶을 때 주석 해제
\ No newline at end of file
+        """결과 차트를 그리고, 지정된 경로에 저장합니다.
+
+        실제 구현은 scr.core.plotting에 있으며 여기서 지연 임포트합니다
+        (최적화 전용 플로우가 matplotlib 로드 비용을 지불하지 않도록).
+        """
+        from . import plotting
+        plotting.plot(self.cerebro, plot_path)
\ No newline at end of file
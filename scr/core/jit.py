@@ -0,0 +1,169 @@
+"""Numba JIT 헬퍼 모듈.
+
+numba가 설치돼 있으면 @njit로 네이티브 컴파일하고, 없으면 데코레이터가
+함수를 그대로 돌려주는 폴백으로 동작해 순수 파이썬으로 실행됩니다.
+전략의 핫패스 커널은 모두 이 모듈의 njit를 통해 데코레이트합니다.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        # numba 미설치 시 no-op 데코레이터
+        if args and callable(args[0]):
+            return args[0]
+
+        def _wrap(func):
+            return func
+        return _wrap
+
+
+@njit(cache=True)
+def ema(values, period):
+    """backtrader의 ExponentialMovingAverage와 동일한 EMA.
+
+    (첫 period개 유효값의 SMA로 시드 후 alpha=2/(period+1) 재귀)
+    워밍업 구간은 NaN으로 채워 반환합니다. 입력의 선행 NaN도 허용합니다.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    fv = -1
+    for i in range(n):
+        if not np.isnan(values[i]):
+            fv = i
+            break
+    if fv < 0 or fv + period > n:
+        return out
+    s = 0.0
+    for i in range(fv, fv + period):
+        s += values[i]
+    prev = s / period
+    out[fv + period - 1] = prev
+    alpha = 2.0 / (period + 1.0)
+    for i in range(fv + period, n):
+        prev = prev + alpha * (values[i] - prev)
+        out[i] = prev
+    return out
+
+
+@njit(cache=True)
+def macd_line(close, fast, slow):
+    """MACD 선(빠른 EMA - 느린 EMA)을 전 구간에 대해 계산합니다."""
+    return ema(close, fast) - ema(close, slow)
+
+
+@njit(cache=True)
+def atr(high, low, close, period):
+    """backtrader ATR과 동일한 Wilder(SMMA) 평활 ATR."""
+    n = close.shape[0]
+    tr = np.empty(n)
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr[i] = max(hl, hc, lc)
+    out = np.full(n, np.nan)
+    if period > n:
+        return out
+    s = 0.0
+    for i in range(period):
+        s += tr[i]
+    prev = s / period
+    out[period - 1] = prev
+    for i in range(period, n):
+        prev = (prev * (period - 1.0) + tr[i]) / period
+        out[i] = prev
+    return out
+
+
+@njit(cache=True)
+def precompute_signals(macd1, macd2, macd3, sig2):
+    """3-MACD 전략의 바별 진입/청산 조건을 전 구간에 대해 한 번에 평가합니다.
+
+    backtrader LineBuffer의 파이썬 __getitem__을 바마다 호출하는 대신,
+    지표 전체 배열을 받아 bool 배열 3개를 돌려줍니다.
+    (지표 워밍업 구간의 NaN 비교는 모두 False가 되므로 안전합니다.)
+
+    반환: (enter, peak, cross_down)
+      - enter: 3개 MACD 선 모두 상승 + 핵심 MACD가 0선 위
+      - peak: 핵심 MACD 선이 직전 봉에서 국소 최대값 (m[i-2] < m[i-1] > m[i])
+      - cross_down: 핵심 MACD 선이 시그널 선을 하향 돌파
+    """
+    n = macd2.shape[0]
+    enter = np.zeros(n, dtype=np.bool_)
+    peak = np.zeros(n, dtype=np.bool_)
+    cross_down = np.zeros(n, dtype=np.bool_)
+    for i in range(2, n):
+        enter[i] = (macd1[i] > macd1[i - 1]
+                    and macd2[i] > macd2[i - 1]
+                    and macd3[i] > macd3[i - 1]
+                    and macd2[i] > 0.0)
+        peak[i] = macd2[i - 2] < macd2[i - 1] and macd2[i - 1] > macd2[i]
+        cross_down[i] = macd2[i - 1] >= sig2[i - 1] and macd2[i] < sig2[i]
+    return enter, peak, cross_down
+
+
+@njit(cache=True, fastmath=True)
+def sharpe(returns):
+    """바별 수익률 배열의 샤프 지수(무위험 수익률 0)를 계산합니다.
+
+    pandas mean/std 두 번의 패스 대신 합/제곱합을 단일 루프로 누적합니다
+    (NaN은 워밍업 구간으로 보고 건너뜀). 표본이 2개 미만이거나 변동이
+    없으면 0을 반환합니다.
+    """
+    n = returns.shape[0]
+    count = 0
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        r = returns[i]
+        if not np.isnan(r):
+            count += 1
+            s += r
+            ss += r * r
+    if count < 2:
+        return 0.0
+    mean = s / count
+    var = (ss - count * mean * mean) / (count - 1)
+    if var <= 0.0:
+        return 0.0
+    return mean / np.sqrt(var)
+
+
+@njit(cache=True, fastmath=True)
+def max_drawdown(equity):
+    """평가금액 곡선의 최대 낙폭(%)을 단일 패스로 계산합니다.
+
+    np.maximum.accumulate + 나눗셈 + max의 임시 배열 3개를 만들지 않고
+    러닝 최고점 대비 낙폭을 루프 안에서 바로 갱신합니다.
+    """
+    n = equity.shape[0]
+    if n == 0:
+        return 0.0
+    peak = equity[0]
+    worst = 0.0
+    for i in range(n):
+        v = equity[i]
+        if v > peak:
+            peak = v
+        if peak > 0.0:
+            dd = (1.0 - v / peak) * 100.0
+            if dd > worst:
+                worst = dd
+    return worst
+
+
+@njit(cache=True)
+def cagr(total_return_pct, years):
+    """총수익률(%)과 기간(년)으로 연복리 수익률(%)을 계산합니다.
+
+    스칼라 한 번은 싸지만 대규모 스윕 집계에서는 행 수만큼 불리는
+    핫패스라 커널로 분리했습니다. 기간 문자열 파싱(연수 계산)은
+    호출자가 캐시해 넘깁니다.
+    """
+    return ((1.0 + total_return_pct * 0.01) ** (1.0 / years) - 1.0) * 100.0
@@ -0,0 +1,20 @@
+"""백테스트 결과 차트 출력 (지연 로드 모듈).
+
+matplotlib은 임포트만으로 수십 MB의 메모리와 수백 ms의 초기화 비용이
+들기 때문에, 순수 최적화 플로우(특히 maxcpus 워커 프로세스)가 이 비용을
+지불하지 않도록 engine.py에서 분리했습니다. 차트가 필요한 곳에서만
+이 모듈을 임포트하세요.
+"""
+
+
+def plot(cerebro, plot_path=None):
+    """결과 차트를 그리고, 지정된 경로에 저장합니다.
+
+    ※ 매매 마커(BuySell 옵저버)를 보려면 stdstats=True로 실행한
+    Cerebro를 전달해야 합니다 (BacktestEngine 기본값은 False).
+    """
+    fig = cerebro.plot(style='candlestick', barup='green', bardown='red')[0][0]
+    if plot_path:
+        fig.savefig(plot_path, dpi=300)
+        print(f"Plot saved to {plot_path}")
+    # plt.show() # 로컬에서 바로 보고 싶을 때 주석 해제
@@ -1,11 +1,27 @@
+import numpy as np
 import backtrader as bt
 
+from .jit import atr, ema, macd_line, precompute_signals
 
+# 러너가 사용 가능한 전략을 찾을 때 dir() 전체를 isinstance/issubclass로
+# 훑지 않도록 명시적 레지스트리를 둡니다. 새 전략은 @register만 붙이면
+# 선택 메뉴에 나타납니다.
+STRATEGY_REGISTRY = {}
+
+
+def register(cls):
+    """전략 클래스를 이름으로 STRATEGY_REGISTRY에 등록하는 데코레이터."""
+    STRATEGY_REGISTRY[cls.__name__] = cls
+    return cls
+
+
+@register
 class SmaCrossStrategy(bt.Strategy):
     """간단한 이동평균선 교차 전략"""
     params = (
         ('fast_ma', 10),
         ('slow_ma', 50),
+        ('debug', False),
     )
 
     def __init__(self):
@@ -19,39 +35,48 @@ class SmaCrossStrategy(bt.Strategy):
         # 빠른 이평선이 느린 이평선을 상향 돌파/하향 돌파하는 것을 감지
         self.crossover = bt.indicators.CrossOver(self.sma_fast, self.sma_slow)
 
+    def _log(self, txt):
+        # debug=False면 포맷팅 비용조차 없이 바로 반환 (최적화 그리드 탐색의 핫패스)
+        if self.p.debug:
+            print(txt)
+
     def next(self):
-        # 디버깅: 현재 데이터 상태 출력
-        print(f"Date: {self.data.datetime.date(0)}, Close: "
-              f"{self.data.close[0]:.2f}, Fast MA: {self.sma_fast[0]:.2f}, "
-              f"Slow MA: {self.sma_slow[0]:.2f}, Crossover: {self.crossover[0]}")
-        
-        # 포지션 상태 및 자본 정보 출력
-        position_size = self.position.size if self.position else 0
-        current_cash = self.broker.getcash()
-        portfolio_value = self.broker.getvalue()
-        print(f"  Position: {position_size}, Cash: {current_cash:.2f}, "
-              f"Portfolio: {portfolio_value:.2f}")
-        
+        if self.p.debug:
+            # 디버깅: 현재 데이터 상태 출력
+            self._log(f"Date: {self.data.datetime.date(0)}, Close: "
+                      f"{self.data.close[0]:.2f}, Fast MA: {self.sma_fast[0]:.2f}, "
+                      f"Slow MA: {self.sma_slow[0]:.2f}, Crossover: {self.crossover[0]}")
+
+            # 포지션 상태 및 자본 정보 출력
+            position_size = self.position.size if self.position else 0
+            current_cash = self.broker.getcash()
+            portfolio_value = self.broker.getvalue()
+            self._log(f"  Position: {position_size}, Cash: {current_cash:.2f}, "
+                      f"Portfolio: {portfolio_value:.2f}")
+
         if not self.position:  # 현재 포지션이 없으면
             if self.crossover > 0:  # 빠른 이평선이 느린 이평선을 상향 돌파 (골든 크로스)
-                print(f"  🟢 BUY SIGNAL at {self.data.datetime.date(0)} - "
-                      f"Attempting to buy...")
+                self._log(f"  🟢 BUY SIGNAL at {self.data.datetime.date(0)} - "
+                          f"Attempting to buy...")
                 self.buy()
-                new_position_size = self.position.size if self.position else 0
-                print(f"  ✅ BUY ORDER EXECUTED - New position size: {new_position_size}")
+                if self.p.debug:
+                    new_position_size = self.position.size if self.position else 0
+                    self._log(f"  ✅ BUY ORDER EXECUTED - New position size: {new_position_size}")
         elif self.crossover < 0:  # 빠른 이평선이 느린 이평선을 하향 돌파 (데드 크로스)
-            print(f"  🔴 SELL SIGNAL at {self.data.datetime.date(0)} - "
-                  f"Attempting to sell...")
+            self._log(f"  🔴 SELL SIGNAL at {self.data.datetime.date(0)} - "
+                      f"Attempting to sell...")
             self.close()
-            print("  ✅ SELL ORDER EXECUTED - Position closed")
-        
+            self._log("  ✅ SELL ORDER EXECUTED - Position closed")
+
         # 거래 후 상태 확인
-        if self.position:
-            print(f"  📊 Current Position: Size={self.position.size}, "
-                  f"Price={self.position.price:.2f}")
-        print("  " + "-"*50)
+        if self.p.debug:
+            if self.position:
+                self._log(f"  📊 Current Position: Size={self.position.size}, "
+                          f"Price={self.position.price:.2f}")
+            self._log("  " + "-"*50)
 
 
+@register
 class MACD_LinePeakStrategy_v2(bt.Strategy):
     """
     [롱 전용] 3-MACD 고급 전략 - 리스크 기반 사이징 + 동적 스톱로스
@@ -115,14 +140,56 @@ class MACD_LinePeakStrategy_v2(bt.Strategy):
         self.stop_price = None
         self.entry_price = None
 
+        # 진입 바마다 재계산할 필요 없는 불변 값은 미리 계산
+        self._risk_frac = self.p.risk_pct / 100.0
+        self._min_qty = self.p.min_qty
+
+        # 미리 계산된 신호/지표 배열 (데이터가 preload된 실행에서만 채워짐)
+        self._sig_enter = None
+        self._sig_peak = None
+        self._sig_crossdn = None
+        self._atr_arr = None
+        self._sig_tried = False
+
+        # hasattr 검사 대신 미리 초기화 (next()가 바마다 호출하는 가드)
+        self.last_signal_bar = -1
+
     def _log(self, txt, dt=None):
         if self.p.debug:
             dt = dt or self.datas[0].datetime.date(0)
             print(f'[{dt.isoformat()}] {txt}')
 
+    def _try_precompute_signals(self):
+        """preload된 close/high/low 배열에서 MACD·ATR을 직접 계산해 둡니다.
+
+        backtrader 지표 그래프(4개 지표 트리)를 거치지 않고 벡터화 EMA로
+        한 번에 계산한 뒤 바별 조건을 bool 배열로 미리 평가합니다.
+        이벤트 모드(배열이 아직 다 안 채워진 경우)에서는 기존
+        LineBuffer 경로로 폴백합니다.
+        """
+        self._sig_tried = True
+        total = self.data.buflen()
+        close_buf = self.data.close.array
+        if total == 0 or len(close_buf) < total:
+            return
+        close = np.asarray(close_buf, dtype=np.float64)
+        high = np.asarray(self.data.high.array, dtype=np.float64)
+        low = np.asarray(self.data.low.array, dtype=np.float64)
+
+        macd1 = macd_line(close, self.p.p_fast1, self.p.p_slow1)
+        macd2 = macd_line(close, self.p.p_fast2, self.p.p_slow2)
+        macd3 = macd_line(close, self.p.p_fast3, self.p.p_slow3)
+        sig2 = ema(macd2, self.p.p_signal)
+
+        self._atr_arr = atr(high, low, close, self.p.atr_len)
+        self._sig_enter, self._sig_peak, self._sig_crossdn = precompute_signals(
+            macd1, macd2, macd3, sig2)
+
     def calculate_stop_distance(self, entry_price):
         """스톱로스 거리 계산"""
         if self.p.sl_mode == 'ATR':
+            if self._atr_arr is not None:
+                return self._atr_arr[len(self.data) - 1] * self.p.atr_mult
             return self.atr[0] * self.p.atr_mult
         elif self.p.sl_mode == 'Percent':
             return entry_price * (self.p.sl_percent / 100)
@@ -132,19 +199,14 @@ class MACD_LinePeakStrategy_v2(bt.Strategy):
             return self.p.sl_ticks * tick_size
 
     def calculate_position_size(self, entry_price, stop_distance):
-        """리스크 기반 포지션 사이징"""
-        try:
-            portfolio_value = self.broker.getvalue()
-            risk_cash = portfolio_value * (self.p.risk_pct / 100)
-            
-            if stop_distance > 0:
-                position_size = risk_cash / stop_distance
-                return max(position_size / entry_price, self.p.min_qty)
-            else:
-                # 스톱 거리가 0이면 기본 사이징
-                return portfolio_value * 0.02 / entry_price  # 2% 포지션
-        except Exception:
-            return self.p.min_qty
+        """리스크 기반 포지션 사이징 (거래당 risk_pct% 손실 한도)"""
+        portfolio_value = self.broker.getvalue()
+        if stop_distance > 0:
+            return max(
+                portfolio_value * self._risk_frac / (stop_distance * entry_price),
+                self._min_qty)
+        # 스톱 거리가 0이면 기본 사이징 (2% 포지션)
+        return portfolio_value * 0.02 / entry_price
 
     def check_stop_loss(self):
         """스톱로스 체크"""
@@ -173,16 +235,20 @@ class MACD_LinePeakStrategy_v2(bt.Strategy):
     def next(self):
         if self.order:
             return
+        # 바 번호/날짜는 라인 조회 비용이 있으므로 한 번만 읽어 재사용
+        bar = len(self.data)
+        datetime_line = self.data.datetime
+
         # 모든 MACD가 안정적으로 계산될 수 있는 기간
-        if len(self.data) < self.p.p_slow2 + self.p.p_signal:
+        if bar < self.p.p_slow2 + self.p.p_signal:
             return
 
         # TradingView와 동일하게 봉 마감 기준으로만 실행 (리페인트 방지)
-        if len(self.data) > 1 and self.data.datetime.date(0) <= self.data.datetime.date(-1):
+        if bar > 1 and datetime_line.date(0) <= datetime_line.date(-1):
             return
 
         # 신호 중복 방지
-        if hasattr(self, 'last_signal_bar') and self.last_signal_bar == len(self.data):
+        if self.last_signal_bar == bar:
             return
 
         # --- 1. 스톱로스 체크 (최우선) ---
@@ -190,26 +256,36 @@ class MACD_LinePeakStrategy_v2(bt.Strategy):
             self._log(f'STOP LOSS TRIGGERED: Price={self.data.close[0]:.4f}, '
                      f'Stop={self.stop_price:.4f}')
             self.order = self.close()
-            self.last_signal_bar = len(self.data)
+            self.last_signal_bar = bar
             return
 
-        # --- 2. 진입 조건 계산 ---
-        trend_1_rising = self.macd_1.macd[0] > self.macd_1.macd[-1]
-        trend_2_rising = self.macd_2_main.macd[0] > self.macd_2_main.macd[-1]
-        trend_3_rising = self.macd_3.macd[0] > self.macd_3.macd[-1]
-        is_unified_uptrend = trend_1_rising and trend_2_rising and trend_3_rising
-        is_macd2_above_zero = self.macd_2_main.macd[0] > 0
-
-        # --- 3. 청산 조건 계산 ---
-        m = self.macd_2_main.macd
-        is_macd_line_peaked = m[-2] < m[-1] > m[0]
-        is_macd_cross_down = self.macd_cross_signal[0] < 0
+        # --- 2. 진입/청산 조건 계산 ---
+        if not self._sig_tried:
+            self._try_precompute_signals()
+
+        if self._sig_enter is not None:
+            # 미리 계산된 bool 배열에서 O(1) 조회
+            i = bar - 1
+            can_enter = self._sig_enter[i]
+            is_macd_line_peaked = self._sig_peak[i]
+            is_macd_cross_down = self._sig_crossdn[i]
+        else:
+            trend_1_rising = self.macd_1.macd[0] > self.macd_1.macd[-1]
+            trend_2_rising = self.macd_2_main.macd[0] > self.macd_2_main.macd[-1]
+            trend_3_rising = self.macd_3.macd[0] > self.macd_3.macd[-1]
+            is_unified_uptrend = trend_1_rising and trend_2_rising and trend_3_rising
+            is_macd2_above_zero = self.macd_2_main.macd[0] > 0
+            can_enter = is_unified_uptrend and is_macd2_above_zero
+
+            m = self.macd_2_main.macd
+            is_macd_line_peaked = m[-2] < m[-1] > m[0]
+            is_macd_cross_down = self.macd_cross_signal[0] < 0
 
         signal_generated = False
 
         # --- 4. 진입 로직 ---
         if not self.position:
-            if is_unified_uptrend and is_macd2_above_zero:
+            if can_enter:
                 entry_price = self.data.close[0]
                 stop_distance = self.calculate_stop_distance(entry_price)
                 position_size = self.calculate_position_size(entry_price, stop_distance)
@@ -244,9 +320,10 @@ class MACD_LinePeakStrategy_v2(bt.Strategy):
 
         # 신호가 발생한 경우 현재 봉을 기록하여 중복 실행 방지
         if signal_generated:
-            self.last_signal_bar = len(self.data)
+            self.last_signal_bar = bar
 
 
+@register
 class MACD_LinePeakStrategy(bt.Strategy):
     """
     [롱 전용] 3-MACD 추세 확인 및 MACD 선(Line) 피크아웃 분할 청산 전략
@@ -259,6 +336,9 @@ class MACD_LinePeakStrategy(bt.Strategy):
       1. (1/2 청산): 5/40 MACD '선'이 정점(Peak)을 찍고 하락으로 전환될 때.
       2. (나머지 청산): 이후, 5/40 MACD 선이 시그널 선을 하향 돌파(데드크로스)할 때.
     """
+    # 그리드 스크리닝용 벡터화 구현 (scr/core/vector_backtest.py의 함수명)
+    vectorized_impl = 'simulate_macd_peak'
+
     params = (
         ('p_fast1', 5),
         ('p_slow1', 20),
@@ -291,11 +371,42 @@ class MACD_LinePeakStrategy(bt.Strategy):
         self.position_level = 0  # 0: 무포지션, 1: 1/2 포지션, 2: 풀포지션
         self.peak_detected = False  # MACD 선 피크 감지 플래그
 
+        # 미리 계산된 신호 배열 (runonce/preload 실행에서만 채워짐)
+        self._sig_enter = None
+        self._sig_peak = None
+        self._sig_crossdn = None
+        self._sig_tried = False
+
+        # hasattr 검사 대신 미리 초기화 (next()가 바마다 호출하는 가드)
+        self.last_signal_bar = -1
+
     def _log(self, txt, dt=None):
         if self.p.debug:
             dt = dt or self.datas[0].datetime.date(0)
             print(f'[{dt.isoformat()}] {txt}')
 
+    def _try_precompute_signals(self):
+        """preload된 close 배열에서 MACD를 직접 계산해 둡니다.
+
+        backtrader 지표 그래프를 거치지 않고 벡터화 EMA로 한 번에 계산한 뒤
+        바별 조건을 bool 배열로 미리 평가합니다. 이벤트 모드(배열이 아직
+        다 안 채워진 경우)에서는 기존 LineBuffer 경로로 폴백합니다.
+        """
+        self._sig_tried = True
+        total = self.data.buflen()
+        close_buf = self.data.close.array
+        if total == 0 or len(close_buf) < total:
+            return
+        close = np.asarray(close_buf, dtype=np.float64)
+
+        macd1 = macd_line(close, self.p.p_fast1, self.p.p_slow1)
+        macd2 = macd_line(close, self.p.p_fast2, self.p.p_slow2)
+        macd3 = macd_line(close, self.p.p_fast3, self.p.p_slow3)
+        sig2 = ema(macd2, self.p.p_signal)
+
+        self._sig_enter, self._sig_peak, self._sig_crossdn = precompute_signals(
+            macd1, macd2, macd3, sig2)
+
     def notify_order(self, order):
         if order.status in [order.Completed]:
             self.order = None
@@ -308,42 +419,56 @@ class MACD_LinePeakStrategy(bt.Strategy):
     def next(self):
         if self.order:
             return
+        # 바 번호/날짜는 라인 조회 비용이 있으므로 한 번만 읽어 재사용
+        bar = len(self.data)
+        datetime_line = self.data.datetime
+
         # 모든 MACD가 안정적으로 계산될 수 있는 기간 + 추세 판단 1봉
-        if len(self.data) < self.p.p_slow2 + self.p.p_signal:
+        if bar < self.p.p_slow2 + self.p.p_signal:
             return
 
         # TradingView와 동일하게 봉 마감 기준으로만 실행 (리페인트 방지)
         # 현재 봉이 이전 봉보다 작거나 같을 때만 실행 (봉 마감 후)
-        if len(self.data) > 1 and self.data.datetime.date(0) <= self.data.datetime.date(-1):
+        if bar > 1 and datetime_line.date(0) <= datetime_line.date(-1):
             return
 
         # 신호 중복 방지: 이미 신호가 발생한 봉인지 확인
-        if hasattr(self, 'last_signal_bar') and self.last_signal_bar == len(self.data):
+        if self.last_signal_bar == bar:
             return
 
-        # --- 1. 진입 조건 계산 ---
-        trend_1_rising = self.macd_1.macd[0] > self.macd_1.macd[-1]
-        trend_2_rising = self.macd_2_main.macd[0] > self.macd_2_main.macd[-1]
-        trend_3_rising = self.macd_3.macd[0] > self.macd_3.macd[-1]
-        is_unified_uptrend = trend_1_rising and trend_2_rising and trend_3_rising
-        is_macd2_above_zero = self.macd_2_main.macd[0] > 0
-
-        # --- 2. 청산 조건 계산 ---
-        # 2-1. [수정] 5/40 'MACD 선'이 피크를 찍고 하락 전환했는가?
-        m = self.macd_2_main.macd
-        # TradingView와 동일한 로직: 직전 봉이 국소 최대값
-        # macd2[2] < macd2[1] > macd2 (이전 < 직전 > 현재)
-        is_macd_line_peaked = m[-2] < m[-1] > m[0]
-
-        # 2-2. 5/40 MACD선이 시그널선을 하향 돌파했는가?
-        is_macd_cross_down = self.macd_cross_signal[0] < 0
+        # --- 1/2. 진입·청산 조건 계산 ---
+        if not self._sig_tried:
+            self._try_precompute_signals()
+
+        if self._sig_enter is not None:
+            # 미리 계산된 bool 배열에서 O(1) 조회
+            i = bar - 1
+            can_enter = self._sig_enter[i]
+            is_macd_line_peaked = self._sig_peak[i]
+            is_macd_cross_down = self._sig_crossdn[i]
+        else:
+            trend_1_rising = self.macd_1.macd[0] > self.macd_1.macd[-1]
+            trend_2_rising = self.macd_2_main.macd[0] > self.macd_2_main.macd[-1]
+            trend_3_rising = self.macd_3.macd[0] > self.macd_3.macd[-1]
+            is_unified_uptrend = trend_1_rising and trend_2_rising and trend_3_rising
+            is_macd2_above_zero = self.macd_2_main.macd[0] > 0
+            can_enter = is_unified_uptrend and is_macd2_above_zero
+
+            # [수정] 5/40 'MACD 선'이 피크를 찍고 하락 전환했는가?
+            # TradingView와 동일한 로직: 직전 봉이 국소 최대값
+            # macd2[2] < macd2[1] > macd2 (이전 < 직전 > 현재)
+            m = self.macd_2_main.macd
+            is_macd_line_peaked = m[-2] < m[-1] > m[0]
+
+            # 5/40 MACD선이 시그널선을 하향 돌파했는가?
+            is_macd_cross_down = self.macd_cross_signal[0] < 0
 
         # --- 3. 매매 실행 로직 ---
         signal_generated = False  # 신호 발생 플래그
 
         # [진입 로직]
         if not self.position:
-            if is_unified_uptrend and is_macd2_above_zero:
+            if can_enter:
                 self._log('BUY SIGNAL: All conditions met. Entering FULL Long position.')
                 self.order = self.buy()
                 self.position_level = 2
@@ -372,7 +497,7 @@ class MACD_LinePeakStrategy(bt.Strategy):
 
         # 신호가 발생한 경우 현재 봉을 기록하여 중복 실행 방지
         if signal_generated:
-            self.last_signal_bar = len(self.data)
+            self.last_signal_bar = bar
 
 
 # 여기에 새로운 전략들을 계속 추가할 수 있습니다.
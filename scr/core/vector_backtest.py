@@ -0,0 +1,102 @@
+"""신호 전용 전략을 위한 벡터화 백테스터.
+
+Cerebro의 바 단위 이벤트 루프(파이썬 next() × N바 × K조합)를 거치지 않고,
+미리 계산된 신호 배열에 대해 단일 패스로 진입/부분청산/최종청산과 PnL을
+시뮬레이션합니다. 그리드 탐색처럼 같은 데이터에 수백~수천 조합을 돌리는
+스크리닝 용도이며, 최적 조합의 정밀 검증/시각화는 기존 Cerebro 경로를
+사용합니다. (체결은 신호 봉 종가 기준 - Cerebro의 다음 봉 체결과는
+미세하게 다를 수 있습니다.)
+"""
+import numpy as np
+
+from .jit import njit, ema, macd_line, precompute_signals, sharpe, max_drawdown
+
+
+@njit(cache=True)
+def _simulate(close, enter, peak, cross_down, cash, commission, percents):
+    """신호 배열을 단일 패스로 시뮬레이션합니다.
+
+    반환: (최종 가치, 총 거래수, 승리 거래수, 바별 평가금액 배열)
+    """
+    n = close.shape[0]
+    equity = np.empty(n)
+
+    size = 0.0
+    position_level = 0  # 0: 무포지션, 1: 1/2 포지션, 2: 풀포지션
+    peak_done = False
+    entry_cost = 0.0
+    proceeds = 0.0
+    trades = 0
+    wins = 0
+
+    for i in range(n):
+        price = close[i]
+
+        if position_level == 0:
+            if enter[i]:
+                spend = cash * percents
+                size = spend / (price * (1.0 + commission))
+                cash -= size * price * (1.0 + commission)
+                entry_cost = size * price
+                proceeds = 0.0
+                position_level = 2
+                peak_done = False
+        else:
+            # 부분 청산 (MACD 피크)
+            if position_level == 2 and peak[i] and not peak_done:
+                half = size * 0.5
+                cash += half * price * (1.0 - commission)
+                proceeds += half * price * (1.0 - commission)
+                size -= half
+                position_level = 1
+                peak_done = True
+            # 최종 청산 (데드크로스)
+            elif cross_down[i]:
+                cash += size * price * (1.0 - commission)
+                proceeds += size * price * (1.0 - commission)
+                size = 0.0
+                position_level = 0
+                trades += 1
+                if proceeds > entry_cost:
+                    wins += 1
+
+        equity[i] = cash + size * price
+
+    return cash + size * close[n - 1], trades, wins, equity
+
+
+def simulate_macd_peak(close, params, cash=1000.0, commission=0.0, percents=0.95):
+    """MACD_LinePeakStrategy의 벡터화 구현.
+
+    close 배열과 전략 파라미터(dict)만으로 한 번의 패스에 신호 생성과
+    PnL 시뮬레이션을 수행하고 analyze_results 형식의 dict를 반환합니다.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+
+    macd1 = macd_line(close, params['p_fast1'], params['p_slow1'])
+    macd2 = macd_line(close, params['p_fast2'], params['p_slow2'])
+    macd3 = macd_line(close, params['p_fast3'], params['p_slow3'])
+    sig2 = ema(macd2, params['p_signal'])
+    enter, peak, cross_down = precompute_signals(macd1, macd2, macd3, sig2)
+
+    final_value, trades, wins, equity = _simulate(
+        close, enter, peak, cross_down,
+        float(cash), float(commission), float(percents))
+
+    # 최대 낙폭/샤프 - 임시 배열 없는 단일 패스 JIT 커널 (jit.py)
+    max_drawdown_pct = float(max_drawdown(equity))
+    if equity.size > 1:
+        bar_returns = np.diff(equity) / equity[:-1]
+        sharpe_ratio = float(sharpe(bar_returns))
+    else:
+        sharpe_ratio = 0.0
+
+    return {
+        'initial_value': cash,
+        'final_value': final_value,
+        'total_return_pct': (final_value / cash - 1) * 100,
+        'sharpe_ratio': sharpe_ratio,
+        'max_drawdown_pct': max_drawdown_pct,
+        'total_trades': trades,
+        'win_rate_pct': (wins / trades * 100) if trades > 0 else 0,
+    }
@@ -1,35 +1,166 @@
 import yaml
 import os
 import sys
+import types
+import heapq
 import pathlib
-import glob
-import pandas as pd
-import backtrader as bt
+import functools
+import itertools
+import multiprocessing
+import concurrent.futures
+from collections import namedtuple
 from datetime import datetime, timedelta
 from colorama import init, Fore, Style
+from tqdm import tqdm
+
+try:
+    # libyaml 기반 C 파서 - 순수 파이썬 SafeLoader보다 10배 이상 빠름
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # 현재 파일의 상위 디렉토리를 Python 경로에 추가
 current_dir = pathlib.Path(__file__).parent.parent.parent
 sys.path.insert(0, str(current_dir))
 
-from scr.core.data import DataFactory
-from scr.core.engine import BacktestEngine
-from scr.core import strategies
+# pandas/backtrader/scr.core.*는 임포트만으로 수백 ms가 걸리므로 첫 메뉴가
+# 뜨기 전에는 로드하지 않음 - 실제 실행 경로의 함수 안에서 지연 임포트
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+class OptResultWriter:
+    """최적화 결과를 Parquet 파일에 행 단위로 스트리밍 기록합니다.
+
+    조합이 수천 개인 그리드에서도 결과를 메모리에 쌓지 않고 바로
+    컬럼 지향 파일로 내보내므로, 중단돼도 지금까지의 결과가 남고
+    사후 분석(pandas/pyarrow)도 바로 가능합니다.
+    pyarrow 미설치 시에는 조용히 no-op으로 동작합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._writer = None
+        self.enabled = pa is not None
+
+    def write(self, analysis):
+        if not self.enabled:
+            return
+        try:
+            # params 딕셔너리는 문자열로 평탄화해 고정 스키마를 유지
+            row = {k: [v] for k, v in analysis.items() if not isinstance(v, dict)}
+            row['params'] = [repr(analysis.get('params', {}))]
+            batch = pa.RecordBatch.from_pydict(row)
+            if self._writer is None:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                self._writer = pq.ParquetWriter(self.path, batch.schema)
+            self._writer.write_batch(batch)
+        except Exception as e:
+            # 결과 기록 실패가 최적화 자체를 중단시키면 안 됨
+            print(f"⚠️ Parquet 결과 기록 비활성화: {e}")
+            self.enabled = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+# 모듈 레벨 DataFactory 공유 (상태가 경로 설정뿐이므로 프로세스당 1개면 충분)
+# - scr.core.data 임포트 비용을 메뉴 단계에서 지불하지 않도록 지연 생성
+_data_factory = None
+
+
+@functools.lru_cache(maxsize=64)
+def _get_feed(symbol, timeframe, start_date, end_date):
+    """(심볼, 타임프레임, 기간) 키로 데이터 피드를 캐시합니다.
+
+    같은 종목을 여러 타임프레임 스윕에서 반복 선택하거나 그리드를 좁혀
+    재실행해도 CSV 파싱과 배열 변환은 프로세스당 한 번만 수행됩니다.
+    NumpyArrayData는 start()에서 커서를 리셋하므로 여러 Cerebro 실행에
+    같은 인스턴스를 재사용해도 안전합니다.
+    """
+    global _data_factory
+    if _data_factory is None:
+        from scr.core.data import DataFactory
+        _data_factory = DataFactory()
+    return _data_factory.get_data_feed(
+        symbol=symbol, timeframe=timeframe,
+        start_date=start_date, end_date=end_date)
+
+
+# multiprocessing.Pool 워커별 상태 (_pool_init이 각 워커에서 채움)
+_worker_state = {}
+
+
+def _pool_init(config):
+    """Pool 워커 초기화: 데이터 피드/전략 클래스를 워커당 한 번만 준비합니다."""
+    from scr.core import strategies
+
+    common = config['common']
+    _worker_state['config'] = config
+    _worker_state['feed'] = _get_feed(
+        common['symbol'], common['timeframe'],
+        common['start_date'], common['end_date'])
+    _worker_state['strategy_class'] = getattr(
+        strategies, config['optimization']['strategy'])
+
+
+def _run_one(params):
+    """워커에서 단일 파라미터 조합을 백테스트하고 analysis dict만 반환합니다.
+
+    backtrader의 optstrategy 내장 병렬화는 전략 인스턴스를 피클하므로
+    피클 불가능한 상태(커스텀 분석기 등)가 끼면 단일 프로세스로 떨어집니다.
+    이 드라이버는 작은 dict만 프로세스 경계를 넘기므로 그 제약이 없습니다.
+    """
+    from scr.core.engine import BacktestEngine
+
+    engine = BacktestEngine(_worker_state['config'], maxcpus=1)
+    engine.add_data(_worker_state['feed'])
+    engine.add_strategy(_worker_state['strategy_class'], params)
+    result = engine.run()
+    analysis = engine.analyze_results(result[0])
+    analysis['params'] = params
+    return analysis
+
+
+DATA_DIR = "data/ohlcv"
+
+
+@functools.lru_cache(maxsize=4)
+def _ohlcv_entries(mtime_ns):
+    """data/ohlcv의 CSV (파일명, 경로) 튜플 목록 (디렉토리 mtime 키 캐시).
+
+    glob.glob은 listdir 전체를 fnmatch로 거르지만 scandir은 단일 시스템
+    콜 패스로 끝나고, 종목 목록/기간 확인이 같은 결과를 공유하므로
+    디렉토리는 메뉴 세션당 한 번만 훑습니다.
+    """
+    entries = []
+    with os.scandir(DATA_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith('.csv'):
+                entries.append((entry.name, entry.path))
+    entries.sort()
+    return tuple(entries)
+
+
+def _list_ohlcv_files():
+    """공유 디렉토리 목록을 반환합니다 (폴더가 없으면 빈 튜플)."""
+    try:
+        return _ohlcv_entries(os.stat(DATA_DIR).st_mtime_ns)
+    except OSError:
+        return ()
 
 
 def get_available_symbols():
     """data/ohlcv 폴더에서 사용 가능한 종목들을 가져옵니다."""
-    data_dir = "data/ohlcv"
-    symbols = set()
-    
-    if os.path.exists(data_dir):
-        for file_path in glob.glob(f"{data_dir}/*.csv"):
-            filename = os.path.basename(file_path)
-            # 파일명에서 종목명 추출 (예: BTCUSDT_1d.csv -> BTCUSDT)
-            symbol = filename.split('_')[0]
-            symbols.add(symbol)
-    
-    return sorted(list(symbols))
+    # 파일명에서 종목명 추출 (예: BTCUSDT_1d.csv -> BTCUSDT)
+    return sorted({name.partition('_')[0] for name, _ in _list_ohlcv_files()})
 
 
 def get_available_timeframes():
@@ -37,53 +168,77 @@ def get_available_timeframes():
     return ['1d', '4h', '1h', '15m', '5m', '3m', '1m']
 
 
+@functools.lru_cache(maxsize=1)
 def get_available_strategies():
-    """strategies.py에서 사용 가능한 전략들을 가져옵니다."""
+    """사용 가능한 전략 이름들을 가져옵니다.
+
+    strategies.py의 명시적 STRATEGY_REGISTRY(@register 데코레이터로
+    채워짐)를 읽으므로 모듈 introspection이 없고, lru_cache 덕에
+    무거운 strategies 임포트도 첫 호출 때 한 번만 일어납니다.
+    """
     try:
-        # strategies 모듈에서 Strategy 클래스들을 찾기
-        strategy_classes = []
-        for attr_name in dir(strategies):
-            attr = getattr(strategies, attr_name)
-            if (isinstance(attr, type) and 
-                issubclass(attr, bt.Strategy) and 
-                attr != bt.Strategy):
-                strategy_classes.append(attr_name)
-        
-        return sorted(strategy_classes)
+        # backtrader/strategies는 무겁기 때문에 필요해진 시점에 임포트
+        from scr.core import strategies
+        return sorted(strategies.STRATEGY_REGISTRY)
     except Exception:
         # 오류 발생 시 기본 전략만 반환
         return ['SmaCrossStrategy']
 
 
+def _pick(prompt, options, default=None):
+    """번호 메뉴 입력을 검증해 options의 값을 반환하는 공통 헬퍼.
+
+    options는 {'1': 값, ...} 형식이고, 빈 입력은 default 키로 처리합니다.
+    KeyboardInterrupt는 여기서 삼키지 않고 그대로 전파합니다 (main에서
+    한 번만 처리). 기존 선택 함수들은 `except (ValueError,
+    KeyboardInterrupt)` 후 `if KeyboardInterrupt:`(항상 참)를 검사해
+    오타만 입력해도 프로그램이 종료되는 버그가 있었습니다.
+    """
+    while True:
+        choice = input(prompt).strip()
+        if choice == '' and default is not None:
+            choice = default
+        if choice in options:
+            return options[choice]
+        print(f"❌ 올바른 값을 입력해주세요. ({'/'.join(options)})")
+
+
+def _pick_multi(prompt, items, example):
+    """쉼표로 구분된 번호 목록(또는 'all')을 검증해 항목 리스트를 반환합니다."""
+    while True:
+        choice = input(prompt).strip().lower()
+
+        if choice == 'all':
+            return list(items)
+
+        # 쉼표로 구분된 선택 처리
+        try:
+            selected_indices = [int(x.strip()) - 1 for x in choice.split(',')]
+        except ValueError:
+            print(f"❌ 올바른 형식으로 입력해주세요. (예: {example} 또는 all)")
+            continue
+
+        if all(0 <= idx < len(items) for idx in selected_indices):
+            return [items[idx] for idx in selected_indices]
+        print("❌ 올바른 숫자를 입력해주세요.")
+
+
 def select_strategy():
     """전략을 선택합니다."""
     strategies = get_available_strategies()
-    
+
     if not strategies:
         print("❌ 사용 가능한 전략이 없습니다.")
         return 'SmaCrossStrategy'  # 기본값
-    
+
     print(f"\n=== 사용 가능한 전략 ({len(strategies)}개) ===")
     for i, strategy in enumerate(strategies, 1):
         print(f"{i}. {strategy}")
-    
-    while True:
-        try:
-            choice = input("\n전략을 선택하세요: ").strip()
-            choice_idx = int(choice) - 1
-            
-            if 0 <= choice_idx < len(strategies):
-                selected_strategy = strategies[choice_idx]
-                print(f"✅ 선택된 전략: {selected_strategy}")
-                return selected_strategy
-            else:
-                print("❌ 올바른 숫자를 입력해주세요.")
-                
-        except (ValueError, KeyboardInterrupt):
-            if KeyboardInterrupt:
-                print("\n\n프로그램을 종료합니다.")
-                sys.exit(0)
-            print("❌ 올바른 숫자를 입력해주세요.")
+
+    options = {str(i): s for i, s in enumerate(strategies, 1)}
+    selected_strategy = _pick("\n전략을 선택하세요: ", options)
+    print(f"✅ 선택된 전략: {selected_strategy}")
+    return selected_strategy
 
 
 def select_config_mode():
@@ -92,108 +247,44 @@ def select_config_mode():
     print("1. config 파일 사용 (기본값)")
     print("2. 수동 설정")
 
-    while True:
-        try:
-            choice = input("\n선택하세요 (1 또는 2, 엔터=기본설정): ").strip()
-            if choice == '' or choice == '1':
-                return '1'  # 엔터키 또는 1 입력 시 config 파일 사용 (기본값)
-            elif choice == '2':
-                return '2'  # 2 입력 시 수동 설정
-            else:
-                print("1, 2 또는 엔터키를 입력해주세요.")
-        except KeyboardInterrupt:
-            print("\n\n프로그램을 종료합니다.")
-            sys.exit(0)
+    return _pick("\n선택하세요 (1 또는 2, 엔터=기본설정): ",
+                 {'1': '1', '2': '2'}, default='1')
 
 
 def select_symbols():
     """종목들을 선택합니다."""
     symbols = get_available_symbols()
-    
+
     if not symbols:
         print("❌ data/ohlcv 폴더에 데이터 파일이 없습니다.")
         sys.exit(1)
-    
+
     print(f"\n=== 사용 가능한 종목 ({len(symbols)}개) ===")
     for i, symbol in enumerate(symbols, 1):
         print(f"{i:2d}. {symbol}")
-    
+
     msg1 = "여러 종목을 선택하려면 쉼표(,)로 구분하세요. (예: 1,3,5)"
     msg2 = "전체 선택: 'all'"
     print(f"\n{Fore.YELLOW}{msg1}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}{msg2}{Style.RESET_ALL}")
-    
-    while True:
-        try:
-            choice = input("\n종목을 선택하세요: ").strip().lower()
-            
-            if choice == 'all':
-                return symbols
-            
-            # 쉼표로 구분된 선택 처리
-            selected_indices = [int(x.strip()) - 1 for x in choice.split(',')]
-            selected_symbols = []
-            
-            for idx in selected_indices:
-                if 0 <= idx < len(symbols):
-                    selected_symbols.append(symbols[idx])
-                else:
-                    print(f"❌ 잘못된 선택: {idx + 1}")
-                    break
-            
-            if len(selected_symbols) == len(selected_indices):
-                return selected_symbols
-            else:
-                print("❌ 올바른 숫자를 입력해주세요.")
-                
-        except (ValueError, KeyboardInterrupt):
-            if KeyboardInterrupt:
-                print("\n\n프로그램을 종료합니다.")
-                sys.exit(0)
-            print("❌ 올바른 형식으로 입력해주세요. (예: 1,3,5 또는 all)")
+
+    return _pick_multi("\n종목을 선택하세요: ", symbols, "1,3,5")
 
 
 def select_timeframes():
     """타임프레임들을 선택합니다."""
     timeframes = get_available_timeframes()
-    
+
     print("\n=== 타임프레임 선택 ===")
     for i, tf in enumerate(timeframes, 1):
         print(f"{i}. {tf}")
-    
+
     msg1 = "여러 타임프레임을 선택하려면 쉼표(,)로 구분하세요. (예: 1,2,3)"
     msg2 = "전체 선택: 'all'"
     print(f"\n{Fore.YELLOW}{msg1}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}{msg2}{Style.RESET_ALL}")
-    
-    while True:
-        try:
-            choice = input("\n타임프레임을 선택하세요: ").strip().lower()
-            
-            if choice == 'all':
-                return timeframes
-            
-            # 쉼표로 구분된 선택 처리
-            selected_indices = [int(x.strip()) - 1 for x in choice.split(',')]
-            selected_timeframes = []
-            
-            for idx in selected_indices:
-                if 0 <= idx < len(timeframes):
-                    selected_timeframes.append(timeframes[idx])
-                else:
-                    print(f"❌ 잘못된 선택: {idx + 1}")
-                    break
-            
-            if len(selected_timeframes) == len(selected_indices):
-                return selected_timeframes
-            else:
-                print("❌ 올바른 숫자를 입력해주세요.")
-                
-        except (ValueError, KeyboardInterrupt):
-            if KeyboardInterrupt:
-                print("\n\n프로그램을 종료합니다.")
-                sys.exit(0)
-            print("❌ 올바른 형식으로 입력해주세요. (예: 1,2,3 또는 all)")
+
+    return _pick_multi("\n타임프레임을 선택하세요: ", timeframes, "1,2,3")
 
 
 def select_backtest_period():
@@ -203,49 +294,42 @@ def select_backtest_period():
     print("2. 최근 몇일")
     print("3. 특정기간 (시작일 ~ 종료일)")
     print("4. 기본설정 (config 파일 사용)")
-    
+
     while True:
-        try:
-            choice = input("\n기간 옵션을 선택하세요 (1-4): ").strip()
-            
-            if choice == '1':
-                return {'type': 'full_period'}
-            elif choice == '2':
-                days = input("최근 몇일을 사용하시겠습니까? (예: 30): ").strip()
-                try:
-                    days = int(days)
-                    if days > 0:
-                        return {'type': 'recent_days', 'days': days}
-                    else:
-                        print("❌ 0보다 큰 숫자를 입력해주세요.")
-                        continue
-                except ValueError:
-                    print("❌ 올바른 숫자를 입력해주세요.")
-                    continue
-            elif choice == '3':
-                start_date = input("시작일을 입력하세요 (YYYY-MM-DD): ").strip()
-                end_date = input("종료일을 입력하세요 (YYYY-MM-DD): ").strip()
-                
-                # 날짜 형식 검증
-                try:
-                    datetime.strptime(start_date, '%Y-%m-%d')
-                    datetime.strptime(end_date, '%Y-%m-%d')
-                    return {
-                        'type': 'custom_period', 
-                        'start_date': start_date, 
-                        'end_date': end_date
-                    }
-                except ValueError:
-                    print("❌ 올바른 날짜 형식을 입력해주세요. (YYYY-MM-DD)")
-                    continue
-            elif choice == '4':
-                return {'type': 'default'}
-            else:
-                print("❌ 1-4 사이의 숫자를 입력해주세요.")
-                
-        except KeyboardInterrupt:
-            print("\n\n프로그램을 종료합니다.")
-            sys.exit(0)
+        period_type = _pick("\n기간 옵션을 선택하세요 (1-4): ",
+                            {'1': 'full_period', '2': 'recent_days',
+                             '3': 'custom_period', '4': 'default'})
+
+        if period_type == 'recent_days':
+            days = input("최근 몇일을 사용하시겠습니까? (예: 30): ").strip()
+            try:
+                days = int(days)
+            except ValueError:
+                print("❌ 올바른 숫자를 입력해주세요.")
+                continue
+            if days > 0:
+                return {'type': 'recent_days', 'days': days}
+            print("❌ 0보다 큰 숫자를 입력해주세요.")
+            continue
+
+        if period_type == 'custom_period':
+            start_date = input("시작일을 입력하세요 (YYYY-MM-DD): ").strip()
+            end_date = input("종료일을 입력하세요 (YYYY-MM-DD): ").strip()
+
+            # 날짜 형식 검증
+            try:
+                datetime.fromisoformat(start_date)
+                datetime.fromisoformat(end_date)
+            except ValueError:
+                print("❌ 올바른 날짜 형식을 입력해주세요. (YYYY-MM-DD)")
+                continue
+            return {
+                'type': 'custom_period',
+                'start_date': start_date,
+                'end_date': end_date
+            }
+
+        return {'type': period_type}
 
 
 def select_optimization_target():
@@ -257,70 +341,78 @@ def select_optimization_target():
     print("4. calmar_ratio (Calmar 비율)")
     print("5. profit_factor (Profit Factor)")
     print("6. win_rate_pct (승률)")
-    
-    while True:
-        try:
-            choice = input("\n최적화 목표를 선택하세요 (1-6): ").strip()
-            
-            if choice == '1':
-                return 'final_value'
-            elif choice == '2':
-                return 'total_return_pct'
-            elif choice == '3':
-                return 'sharpe_ratio'
-            elif choice == '4':
-                return 'calmar_ratio'
-            elif choice == '5':
-                return 'profit_factor'
-            elif choice == '6':
-                return 'win_rate_pct'
-            else:
-                print("❌ 1-6 사이의 숫자를 입력해주세요.")
-                
-        except KeyboardInterrupt:
-            print("\n\n프로그램을 종료합니다.")
-            sys.exit(0)
+
+    return _pick("\n최적화 목표를 선택하세요 (1-6): ",
+                 {'1': 'final_value', '2': 'total_return_pct',
+                  '3': 'sharpe_ratio', '4': 'calmar_ratio',
+                  '5': 'profit_factor', '6': 'win_rate_pct'})
+
+
+# 전략 이름 → 최적화 파라미터 범위. 호출 시마다 dict를 재구성하지 않도록
+# 모듈 레벨 상수로 두고, MappingProxyType으로 감싸 실수로 인한 변형을 차단
+_DEFAULT_OPT_PARAMS = types.MappingProxyType({
+    'fast_ma': (10, 30, 5),
+    'slow_ma': (40, 80, 10)
+})
+
+_STRATEGY_OPT_PARAMS = types.MappingProxyType({
+    'SmaCrossStrategy': types.MappingProxyType({
+        'fast_ma': (5, 50, 5),      # (시작값, 끝값, 스텝)
+        'slow_ma': (20, 100, 10)
+    }),
+    'MACD_LinePeakStrategy': types.MappingProxyType({
+        'p_fast1': (3, 10, 1),
+        'p_slow1': (15, 30, 5),
+        'p_fast2': (3, 10, 1),
+        'p_slow2': (30, 60, 10),
+        'p_signal': (5, 15, 2)
+    }),
+    'MACD_LinePeakStrategy_v2': types.MappingProxyType({
+        'p_fast1': (3, 10, 1),
+        'p_slow1': (15, 30, 5),
+        'p_fast2': (3, 10, 1),
+        'p_slow2': (30, 60, 10),
+        'p_signal': (5, 15, 2),
+        'risk_pct': (0.5, 2.0, 0.5),
+        'atr_mult': (1.5, 3.0, 0.5)
+    }),
+})
 
 
 def get_strategy_optimization_params(strategy_name):
-    """전략별 최적화 파라미터를 반환합니다."""
-    if strategy_name == 'SmaCrossStrategy':
-        return {
-            'fast_ma': (5, 50, 5),      # (시작값, 끝값, 스텝)
-            'slow_ma': (20, 100, 10)
-        }
-    elif strategy_name == 'MACD_LinePeakStrategy':
-        return {
-            'p_fast1': (3, 10, 1),
-            'p_slow1': (15, 30, 5),
-            'p_fast2': (3, 10, 1),
-            'p_slow2': (30, 60, 10),
-            'p_signal': (5, 15, 2)
-        }
-    elif strategy_name == 'MACD_LinePeakStrategy_v2':
-        return {
-            'p_fast1': (3, 10, 1),
-            'p_slow1': (15, 30, 5),
-            'p_fast2': (3, 10, 1),
-            'p_slow2': (30, 60, 10),
-            'p_signal': (5, 15, 2),
-            'risk_pct': (0.5, 2.0, 0.5),
-            'atr_mult': (1.5, 3.0, 0.5)
-        }
-    else:
-        # 기본값
-        return {
-            'fast_ma': (10, 30, 5),
-            'slow_ma': (40, 80, 10)
-        }
+    """전략별 최적화 파라미터의 복사본을 반환합니다.
+
+    원본은 위의 읽기 전용 매핑이지만, 반환값은 config에 담겨 워커
+    프로세스로 피클될 수 있으므로(mappingproxy는 피클 불가) dict 복사본을
+    돌려줍니다.
+    """
+    return dict(_STRATEGY_OPT_PARAMS.get(strategy_name, _DEFAULT_OPT_PARAMS))
+
+
+CONFIG_PATH = "config/main_config.yaml"
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_main_config(mtime_ns):
+    """main_config.yaml을 파싱합니다 (mtime 키 캐시 - 변경 시에만 재파싱)."""
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_main_config():
+    """설정 파일을 읽어 dict로 반환합니다.
+
+    config 모드 진입과 get_period_dates의 기본값 분기가 같은 파일을
+    반복해서 읽으므로 파싱은 프로세스당 최대 한 번만 수행됩니다.
+    """
+    return _parse_main_config(os.stat(CONFIG_PATH).st_mtime_ns)
 
 
 def run_optimization_with_config():
     """config 파일을 사용하여 최적화를 실행합니다."""
-    
+
     try:
-        with open("config/main_config.yaml", 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = load_main_config()
 
         common_cfg = config['common']
         opt_cfg = config['optimization']
@@ -338,25 +430,22 @@ def run_optimization_with_config():
         print(f"최적화 목표: {opt_cfg['optimize_target']}")
         
         # 다종목, 다중 타임프레임 설정인 경우 config를 확장
+        # (공통 부분은 한 번만 만들고, 하위 dict는 읽기 전용으로 공유)
         if 'symbols' in common_cfg and 'timeframes' in common_cfg:
-            configs = []
-            for symbol in common_cfg['symbols']:
-                for timeframe in common_cfg['timeframes']:
-                    # 각 조합에 대한 개별 config 생성
-                    single_config = {
-                        'common': {
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'start_date': common_cfg['start_date'],
-                            'end_date': common_cfg['end_date'],
-                            'initial_cash': common_cfg.get('initial_cash', 1000.0),
-                            'commission': common_cfg.get('commission', 0.0015)
-                        },
-                        'optimization': opt_cfg.copy(),
-                        'results_path': config.get('results_path', {})
-                    }
-                    configs.append(single_config)
-            return configs
+            base_common = {
+                'start_date': common_cfg['start_date'],
+                'end_date': common_cfg['end_date'],
+                'initial_cash': common_cfg.get('initial_cash', 1000.0),
+                'commission': common_cfg.get('commission', 0.0015)
+            }
+            shared_opt = opt_cfg.copy()
+            shared_paths = config.get('results_path', {})
+            return [{'common': {**base_common,
+                                'symbol': symbol, 'timeframe': timeframe},
+                     'optimization': shared_opt,
+                     'results_path': shared_paths}
+                    for symbol in common_cfg['symbols']
+                    for timeframe in common_cfg['timeframes']]
         else:
             return config
         
@@ -376,131 +465,194 @@ def run_optimization_manual(symbols, timeframes, period_config, selected_strateg
     print(f"선택된 전략: {selected_strategy}")
     print(f"최적화 목표: {optimization_target}")
     
-    # 기간 설정에 따른 시작일과 종료일 결정
-    start_date, end_date = get_period_dates(period_config)
+    # 기간 설정에 따른 시작일과 종료일 결정 (연/월 분모 포함 1회 계산)
+    period = get_period_dates(period_config)
+    start_date, end_date = period.start_date, period.end_date
     print(f"백테스트 기간: {start_date} ~ {end_date}")
     
     # 전략별 최적화 파라미터 설정
     optimization_params = get_strategy_optimization_params(selected_strategy)
-    
-    # 모든 조합에 대한 config 리스트 생성
-    configs = []
-    
-    for symbol in symbols:
-        for timeframe in timeframes:
-            config = {
-                'common': {
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'initial_cash': 1000.0,
-                    'commission': 0.0015
-                },
-                'optimization': {
-                    'strategy': selected_strategy,
-                    'params_to_optimize': optimization_params,
-                    'optimize_target': optimization_target
-                },
-                'results_path': {
-                    'base': 'results',
-                    'simple': 'simple',
-                    'optimization': 'optimization',
-                    'walk_forward': 'walk_forward'
-                }
-            }
-            configs.append(config)
-    
-    return configs
+
+    # 모든 조합에 대한 config 리스트 생성 - 공통 부분은 한 번만 만들고
+    # 조합별로는 symbol/timeframe만 덮어씀 (하위 dict는 읽기 전용 공유)
+    base_common = {
+        'start_date': start_date,
+        'end_date': end_date,
+        'initial_cash': 1000.0,
+        'commission': 0.0015
+    }
+    shared_opt = {
+        'strategy': selected_strategy,
+        'params_to_optimize': optimization_params,
+        'optimize_target': optimization_target
+    }
+    shared_paths = {
+        'base': 'results',
+        'simple': 'simple',
+        'optimization': 'optimization',
+        'walk_forward': 'walk_forward'
+    }
+
+    return [{'common': {**base_common, 'symbol': symbol, 'timeframe': timeframe},
+             'optimization': shared_opt,
+             'results_path': shared_paths}
+            for symbol in symbols
+            for timeframe in timeframes]
+
+
+# 스윕 전체가 공유하는 기간 정보 - 연/월 분모를 한 번만 계산해 둠
+PeriodInfo = namedtuple('PeriodInfo', ['start_date', 'end_date', 'years', 'months'])
+
+
+def _make_period_info(start_date, end_date):
+    """'YYYY-MM-DD' 문자열 쌍으로 PeriodInfo를 만듭니다 (분모 사전 계산)."""
+    days = _period_days(f"{start_date} ~ {end_date}") or 0
+    return PeriodInfo(start_date, end_date, days / 365.25, days / 30.44)
 
 
 def get_period_dates(period_config):
-    """기간 설정에 따라 시작일과 종료일을 반환합니다."""
+    """기간 설정에 따라 기간 정보(PeriodInfo)를 반환합니다.
+
+    반환값은 (start_date, end_date, years, months) namedtuple로, 기간
+    파싱과 연/월 분모 계산이 스윕당 한 번만 수행됩니다.
+    """
     if period_config['type'] == 'full_period':
         # 전체기간: 데이터의 처음부터 끝까지
-        return get_actual_data_period()
-    
+        return _make_period_info(*get_actual_data_period())
+
     elif period_config['type'] == 'recent_days':
         # 최근 몇일
         days = period_config['days']
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
-        return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
-    
+        return _make_period_info(start_date.strftime('%Y-%m-%d'),
+                                 end_date.strftime('%Y-%m-%d'))
+
     elif period_config['type'] == 'custom_period':
         # 특정기간
-        return period_config['start_date'], period_config['end_date']
-    
+        return _make_period_info(period_config['start_date'],
+                                 period_config['end_date'])
+
     else:  # default
         # 기본설정: config 파일 사용
         try:
-            with open("config/main_config.yaml", 'r', encoding='utf-8') as f:
-                config_from_file = yaml.safe_load(f)
+            config_from_file = load_main_config()
             start_date = config_from_file['common']['start_date']
             end_date = config_from_file['common']['end_date']
-            return start_date, end_date
+            return _make_period_info(start_date, end_date)
         except Exception:
             # config 파일을 읽을 수 없는 경우 기본값 반환
-            return '2024-01-01', '2025-01-01'
+            return _make_period_info('2024-01-01', '2025-01-01')
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_data_period(sample_file, mtime_ns):
+    """샘플 CSV에서 (시작일, 종료일)을 읽습니다 (파일 mtime 키 캐시).
+
+    CSV는 시간순 정렬돼 있으므로 전체를 파싱할 필요 없이 헤더+첫 데이터
+    행과 파일 끝 바이트 범위만 읽으면 됩니다 (수백만 행이어도 O(1)).
+    끝부분 탐색이 실패하면 timestamp 컬럼만 청크 단위로 읽어 폴백합니다.
+    """
+    try:
+        with open(sample_file, 'rb') as f:
+            header = f.readline().decode('utf-8').strip().split(',')
+            if 'timestamp' not in header:
+                return None
+            ts_idx = header.index('timestamp')
+
+            first_row = f.readline().decode('utf-8').strip().split(',')
+
+            # 마지막 행: 파일 끝 8KB만 읽어 마지막 완전한 행을 취함
+            try:
+                f.seek(-8192, os.SEEK_END)
+            except OSError:
+                f.seek(0)  # 8KB보다 작은 파일
+            last_row = f.read().splitlines()[-1].decode('utf-8').strip().split(',')
+
+        start_dt = datetime.fromisoformat(first_row[ts_idx])
+        end_dt = datetime.fromisoformat(last_row[ts_idx])
+        return start_dt.strftime('%Y-%m-%d'), end_dt.strftime('%Y-%m-%d')
+
+    except (ValueError, IndexError, OSError):
+        # 폴백: timestamp 컬럼만 청크로 읽어 min/max 계산 (메모리 상한 유지)
+        import pandas as pd
+
+        start_ts = None
+        end_ts = None
+        for chunk in pd.read_csv(sample_file, usecols=['timestamp'],
+                                 chunksize=1_000_000):
+            ts = pd.to_datetime(chunk['timestamp'])
+            chunk_min, chunk_max = ts.min(), ts.max()
+            start_ts = chunk_min if start_ts is None else min(start_ts, chunk_min)
+            end_ts = chunk_max if end_ts is None else max(end_ts, chunk_max)
+
+        if start_ts is None:
+            return None
+        return start_ts.strftime('%Y-%m-%d'), end_ts.strftime('%Y-%m-%d')
 
 
 def get_actual_data_period():
     """실제 데이터 파일에서 사용 가능한 기간을 확인합니다."""
     try:
-        # data/ohlcv 폴더에서 첫 번째 CSV 파일을 찾아서 기간 확인
-        data_dir = "data/ohlcv"
-        if os.path.exists(data_dir):
-            csv_files = glob.glob(f"{data_dir}/*.csv")
-            if csv_files:
-                # 첫 번째 파일로 기간 확인
-                sample_file = csv_files[0]
-                df = pd.read_csv(sample_file)
-                
-                if 'timestamp' in df.columns:
-                    # timestamp 컬럼을 datetime으로 변환
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
-                    
-                    # 시작일과 종료일 추출
-                    start_date = df['timestamp'].min().strftime('%Y-%m-%d')
-                    end_date = df['timestamp'].max().strftime('%Y-%m-%d')
-                    
-                    return start_date, end_date
-        
+        # 공유 디렉토리 목록에서 첫 번째 CSV 파일을 찾아서 기간 확인
+        entries = _list_ohlcv_files()
+        sample_file = entries[0][1] if entries else None
+
+        if sample_file:
+            period = _scan_data_period(sample_file,
+                                       os.stat(sample_file).st_mtime_ns)
+            if period:
+                return period
+
         # 기본값 반환 (데이터 파일을 찾을 수 없는 경우)
         return '2024-01-01', '2025-01-01'
-        
+
     except Exception:
         # 오류 발생 시 기본값 반환
         return '2024-01-01', '2025-01-01'
 
 
+@functools.lru_cache(maxsize=128)
+def _period_days(period_str):
+    """'YYYY-MM-DD ~ YYYY-MM-DD' 문자열의 일수를 반환합니다 (파싱 캐시).
+
+    같은 스윕의 모든 결과 행이 동일한 period_str을 공유하므로 strptime은
+    고유 기간당 한 번만 실행됩니다. 형식이 맞지 않으면 None을 반환합니다.
+    """
+    try:
+        if '~' not in period_str:
+            return None
+        start_date, end_date = period_str.split('~')
+        return (_parse_date(end_date.strip())
+                - _parse_date(start_date.strip())).days
+    except Exception:
+        return None
+
+
+def _parse_date(date_str):
+    """날짜 문자열을 datetime으로 파싱합니다.
+
+    fromisoformat은 C 구현 전용 경로라 strptime보다 수 배 빠르지만
+    '2025-7-01' 같은 비패딩 날짜를 거부하므로 strptime으로 폴백합니다.
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+
+
 def calculate_cagr(total_return_pct, period_str):
     """연복리 수익률(CAGR)을 계산합니다."""
+    days = _period_days(period_str)
+    if days is None or days <= 0:
+        # period 정보가 없거나 기간이 0이면 원래 수익률 반환
+        return total_return_pct
+
     try:
-        # period 문자열에서 시작일과 종료일 추출
-        if '~' in period_str:
-            start_date, end_date = period_str.split('~')
-            start_date = start_date.strip()
-            end_date = end_date.strip()
-            
-            # 날짜 파싱
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            # 기간 계산 (년 단위)
-            years = (end_dt - start_dt).days / 365.25
-            
-            if years > 0:
-                # CAGR 공식: (1 + total_return)^(1/years) - 1
-                total_return = total_return_pct / 100
-                cagr = ((1 + total_return) ** (1/years) - 1) * 100
-                return cagr
-            else:
-                return total_return_pct
-        else:
-            # period 정보가 없으면 원래 수익률 반환
-            return total_return_pct
-            
+        # CAGR 공식: (1 + total_return)^(1/years) - 1
+        years = days / 365.25
+        total_return = total_return_pct / 100
+        return ((1 + total_return) ** (1 / years) - 1) * 100
     except Exception:
         # 오류 발생 시 원래 수익률 반환
         return total_return_pct
@@ -508,37 +660,28 @@ def calculate_cagr(total_return_pct, period_str):
 
 def calculate_monthly_trades(total_trades, period_str):
     """월평균 거래수를 계산합니다."""
-    try:
-        # period 문자열에서 시작일과 종료일을 추출
-        if '~' in period_str:
-            start_date, end_date = period_str.split('~')
-            start_date = start_date.strip()
-            end_date = end_date.strip()
-            
-            # 날짜 파싱
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            # 기간 계산 (월 단위)
-            months = (end_dt - start_dt).days / 30.44  # 평균 월 일수
-            
-            if months > 0:
-                # 월평균 거래수 계산
-                monthly_trades = total_trades / months
-                return monthly_trades
-            else:
-                return total_trades
-        else:
-            # period 정보가 없으면 원래 거래수 반환
-            return total_trades
-            
-    except Exception:
-        # 오류 발생 시 원래 거래수 반환
+    days = _period_days(period_str)
+    if days is None or days <= 0:
+        # period 정보가 없으면 원래 거래수 반환
         return total_trades
 
+    months = days / 30.44  # 평균 월 일수
+    return total_trades / months
+
+
+# 결과 테이블 행 포맷 - 루프 밖에서 한 번만 구성 (행당 문자열 연결 제거)
+_ROW_FMT = ("{c}{rank:<6} {symbol:<10} {tf:<5} {params:<30} {ret:>14} "
+            "{sharpe:>8.2f} {calmar:>8.2f} {mdd:>7.1f}% {trades:>8.0f} "
+            "{win:>7.1f}% {pf:>6.2f}{r}")
+
 
-def print_optimization_summary(all_results, target_metric='final_value'):
-    """최적화 결과를 상세하고 가독성 좋게 출력합니다."""
+def print_optimization_summary(all_results, target_metric='final_value', totals=None):
+    """최적화 결과를 상세하고 가독성 좋게 출력합니다.
+
+    totals가 주어지면 (스트리밍 집계: count/profitable/worst_return)
+    all_results에는 상위 K개 행만 넘어와도 전체 스윕 기준의 통계를
+    표시할 수 있습니다.
+    """
     print(f"\n{Fore.CYAN}{Style.BRIGHT}=== 최적화 결과 요약 ==={Style.RESET_ALL}")
     
     if not all_results:
@@ -547,68 +690,95 @@ def print_optimization_summary(all_results, target_metric='final_value'):
     
     # 유효한 결과만 필터링
     valid_results = [r for r in all_results if target_metric in r and r[target_metric] is not None]
-    
+
     if not valid_results:
         print("❌ 유효한 결과가 없습니다.")
         return
-    
-    # 결과를 target_metric 기준으로 정렬
-    valid_results.sort(key=lambda x: x[target_metric], reverse=True)
-    
-    # 전체 통계 정보
-    total_combinations = len(valid_results)
-    profitable_count = len([r for r in valid_results if r.get('total_return_pct', 0) > 0])
+
+    # 단일 DataFrame으로 벡터화 집계 - 행별 .get()/strptime 루프를 제거하고
+    # 문자열 포매팅은 상위 10개 행에 대해서만 수행
+    import pandas as pd
+
+    df = pd.DataFrame(valid_results)
+
+    for col in ('total_return_pct', 'sharpe_ratio', 'max_drawdown_pct',
+                'total_trades', 'win_rate_pct', 'profit_factor'):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
+        else:
+            df[col] = 0.0
+
+    # 'YYYY-MM-DD ~ YYYY-MM-DD' 기간을 열 단위로 한 번에 파싱 → 연 수
+    if 'period' in df.columns:
+        period_parts = df['period'].astype(str).str.split('~', n=1, expand=True)
+        start = pd.to_datetime(period_parts[0].str.strip(), errors='coerce')
+        if period_parts.shape[1] > 1:
+            end = pd.to_datetime(period_parts[1].str.strip(), errors='coerce')
+        else:
+            end = start
+        years = (end - start).dt.days / 365.25
+    else:
+        years = pd.Series(0.0, index=df.index)
+
+    # CAGR/Calmar/MDD도 배열 연산으로 일괄 계산
+    ret = df['total_return_pct']
+    cagr = ((1 + ret / 100).pow(1 / years.where(years > 0)) - 1) * 100
+    df['cagr'] = cagr.fillna(ret)  # 기간 정보가 없으면 원래 수익률 (기존 동작)
+    df['mdd'] = df['max_drawdown_pct'].abs()
+    df['calmar'] = (ret / df['mdd']).where(df['mdd'] > 0, 0.0)
+
+    # 전체 통계 정보 (스트리밍 집계가 있으면 전체 스윕 기준으로 표시)
+    metric_values = df[target_metric].to_numpy()
+    best_result = valid_results[int(metric_values.argmax())]
+
+    if totals is not None:
+        total_combinations = totals['count']
+        profitable_count = totals['profitable']
+        worst_return_pct = totals.get('worst_return') or 0
+    else:
+        total_combinations = len(df)
+        profitable_count = int((ret > 0).sum())
+        worst_return_pct = valid_results[int(metric_values.argmin())].get(
+            'total_return_pct', 0)
     profitable_rate = (profitable_count / total_combinations * 100) if total_combinations > 0 else 0
-    
-    best_result = valid_results[0] if valid_results else None
-    worst_result = valid_results[-1] if valid_results else None
-    
+
     print(f"{Fore.CYAN}📊 전체 통계:{Style.RESET_ALL}")
     print(f"   • 총 테스트 조합: {total_combinations:,}개")
     print(f"   • 수익성 조합: {profitable_count:,}개 ({profitable_rate:.1f}%)")
     if best_result:
         print(f"   • 최고 수익률: {best_result.get('total_return_pct', 0):.2f}%")
         print(f"   • 최고 {target_metric}: {best_result[target_metric]:.2f}")
-    if worst_result:
-        print(f"   • 최저 수익률: {worst_result.get('total_return_pct', 0):.2f}%")
-    
+    print(f"   • 최저 수익률: {worst_return_pct:.2f}%")
+
     # 백테스트 기간 정보
-    if valid_results and 'period' in valid_results[0]:
+    if 'period' in valid_results[0]:
         print(f"   • 백테스트 기간: {valid_results[0]['period']}")
-    
+
     print()
-    
+
     # 상위 10개 결과를 상세 테이블로 출력
     print(f"{Fore.YELLOW}{Style.BRIGHT}🏆 {target_metric} 기준 상위 결과:{Style.RESET_ALL}")
     print()
-    
+
     # 헤더 출력
     print(f"{Fore.YELLOW}{Style.BRIGHT}{'Rank':<6} {'Symbol':<10} {'TF':<5} {'Params':<30} {'Return% (CAGR)':>15} {'Sharpe':>8} {'Calmar':>8} {'MDD%':>7} {'Trades':>8} {'Win%':>7} {'PF':>6}{Style.RESET_ALL}")
     print("=" * 120)
-    
-    # 상위 10개 결과 출력
-    top_results = valid_results[:10]
-    for rank, result in enumerate(top_results, 1):
-        # 기본 정보
-        symbol = result.get('symbol', 'N/A')
-        timeframe = result.get('timeframe', 'N/A')
-        params = result.get('params', {})
-        
-        # 성과 지표 (안전 처리)
-        return_pct = result.get('total_return_pct', 0) or 0
-        sharpe = result.get('sharpe_ratio', 0) or 0
-        mdd = abs(result.get('max_drawdown_pct', 0) or 0)
-        trades = result.get('total_trades', 0) or 0
-        win_rate = result.get('win_rate_pct', 0) or 0
-        profit_factor = result.get('profit_factor', 0) or 0
-        
-        # Calmar Ratio 계산
-        calmar_ratio = (return_pct / mdd) if mdd > 0 else 0
-        
-        # CAGR 계산
-        period_str = result.get('period', '')
-        cagr = calculate_cagr(return_pct, period_str)
-        
+
+    # 파일로 리다이렉트된 출력에는 ANSI 코드를 아예 넣지 않음
+    if sys.stdout.isatty():
+        green, red, reset = Fore.GREEN, Fore.RED, Style.RESET_ALL
+    else:
+        green = red = reset = ''
+
+    # 상위 10개만 선택 (전체 정렬 없이 부분 선택) 후 문자열 포매팅
+    top_df = df.nlargest(10, target_metric)
+    for rank, row in enumerate(top_df.to_dict('records'), 1):
+        symbol = row.get('symbol', 'N/A')
+        timeframe = row.get('timeframe', 'N/A')
+        params = row.get('params') or {}
+
+        return_pct = row['total_return_pct']
+
         # 파라미터 문자열 생성 (간략화)
         if params:
             param_str = ', '.join([f"{k}={v}" for k, v in list(params.items())[:3]])
@@ -616,19 +786,21 @@ def print_optimization_summary(all_results, target_metric='final_value'):
                 param_str += "..."
         else:
             param_str = "N/A"
-        
+
         # 파라미터 문자열 길이 제한
         if len(param_str) > 28:
             param_str = param_str[:25] + "..."
-        
-        # 색상 결정
-        color = Fore.GREEN if return_pct > 0 else Fore.RED
-        
+
         # 수익률 표시 형태: 총수익률(CAGR)
-        return_cagr_display = f"{return_pct:.1f}({cagr:.1f})"
-        
-        print(f"{color}{rank:<6} {symbol:<10} {timeframe:<5} {param_str:<30} {return_cagr_display:>14} {sharpe:>8.2f} {calmar_ratio:>8.2f} {mdd:>7.1f}% {trades:>8.0f} {win_rate:>7.1f}% {profit_factor:>6.2f}{Style.RESET_ALL}")
-    
+        return_cagr_display = f"{return_pct:.1f}({row['cagr']:.1f})"
+
+        print(_ROW_FMT.format(
+            c=green if return_pct > 0 else red,
+            rank=rank, symbol=symbol, tf=timeframe, params=param_str,
+            ret=return_cagr_display, sharpe=row['sharpe_ratio'],
+            calmar=row['calmar'], mdd=row['mdd'], trades=row['total_trades'],
+            win=row['win_rate_pct'], pf=row['profit_factor'], r=reset))
+
     print("=" * 120)
     
     # 최적 파라미터 상세 정보
@@ -734,99 +906,222 @@ def print_final_analysis_settings(configs):
             return False
 
 
+def _run_config(config, maxcpus=None):
+    """단일 (심볼, 타임프레임) config의 최적화를 실행합니다.
+
+    config 간에 공유 상태가 없어 ProcessPoolExecutor로 config 단위
+    병렬화가 가능하도록 최상위 함수로 둡니다 (피클 가능). 데이터 로드와
+    탐색 방식 분기까지만 담당하고, 결과 기록/요약은 호출 측에서 합니다.
+    반환값은 작은 analysis dict의 리스트뿐입니다.
+    """
+    from scr.core import strategies
+    from scr.core.engine import BacktestEngine
+
+    # 데이터 준비 (프로세스 내 피드 캐시 사용)
+    data_feed = _get_feed(
+        config['common']['symbol'],
+        config['common']['timeframe'],
+        config['common']['start_date'],
+        config['common']['end_date'])
+
+    # 최적화 엔진 설정 및 실행
+    engine = BacktestEngine(config, maxcpus=maxcpus)
+    engine.add_data(data_feed)
+
+    opt_cfg = config['optimization']
+    strategy_class = getattr(strategies, opt_cfg['strategy'])
+    period_str = f"{config['common']['start_date']} ~ {config['common']['end_date']}"
+
+    if (opt_cfg.get('search') == 'vectorized'
+            and getattr(strategy_class, 'vectorized_impl', None)):
+        # 벡터화 경로: Cerebro 이벤트 루프 없이 신호 배열 단일 패스
+        print("🔄 벡터화 최적화 실행 중...")
+        grid = {k: (range(*v) if isinstance(v, list) and len(v) == 3 else v)
+                for k, v in opt_cfg['params_to_optimize'].items()}
+        final_results = []
+        for combo in itertools.product(*grid.values()):
+            params = dict(zip(grid.keys(), combo))
+            analysis = engine.run_vectorized(strategy_class, params)
+            analysis['symbol'] = config['common']['symbol']
+            analysis['timeframe'] = config['common']['timeframe']
+            analysis['period'] = period_str
+            final_results.append(analysis)
+        print(f"✅ 최적화 완료: {len(final_results)}개 조합 테스트")
+    elif opt_cfg.get('search') == 'bayesian':
+        # 베이지안 탐색: 전수 그리드 대신 Optuna TPE로 유망 조합만 평가
+        print("🔄 베이지안 최적화 실행 중...")
+        final_results = engine.run_bayesian(
+            strategy_class, opt_cfg['params_to_optimize'],
+            n_trials=opt_cfg.get('n_trials', 50),
+            patience=opt_cfg.get('patience', 10))
+        print(f"✅ 최적화 완료: {len(final_results)}개 조합 테스트")
+        for analysis in final_results:
+            analysis['symbol'] = config['common']['symbol']
+            analysis['timeframe'] = config['common']['timeframe']
+            analysis['period'] = period_str
+    elif opt_cfg.get('search') == 'pool':
+        # 수동 Pool 드라이버: 조합별로 워커에서 독립 Cerebro 실행
+        # (optstrategy 내장 병렬화의 피클 제약 우회 + 진행률 표시)
+        print("🔄 병렬 그리드 최적화 실행 중...")
+        grid = {k: (list(range(*v)) if isinstance(v, list) and len(v) == 3 else v)
+                for k, v in opt_cfg['params_to_optimize'].items()}
+        param_dicts = [dict(zip(grid.keys(), combo))
+                       for combo in itertools.product(*grid.values())]
+
+        processes = opt_cfg.get('processes') or os.cpu_count()
+        final_results = []
+        with multiprocessing.Pool(processes=processes,
+                                  initializer=_pool_init,
+                                  initargs=(config,)) as pool:
+            for analysis in tqdm(pool.imap_unordered(_run_one, param_dicts),
+                                 total=len(param_dicts),
+                                 desc="조합 테스트"):
+                analysis['symbol'] = config['common']['symbol']
+                analysis['timeframe'] = config['common']['timeframe']
+                analysis['period'] = period_str
+                final_results.append(analysis)
+        print(f"✅ 최적화 완료: {len(final_results)}개 조합 테스트")
+    else:
+        # 기본 경로: Cerebro optstrategy 전수 그리드
+        engine.add_optimizer(strategy_class, opt_cfg['params_to_optimize'])
+
+        print("🔄 최적화 실행 중...")
+        opt_results = engine.run()
+
+        final_results = []
+        if opt_results:
+            print(f"✅ 최적화 완료: {len(opt_results)}개 조합 테스트")
+
+            # params.__dict__는 프레임워크 내부 키까지 복사하므로 사용자가
+            # 최적화 대상으로 지정한 키만 추출 (키 목록은 루프 밖에서 1회)
+            param_keys = tuple(opt_cfg['params_to_optimize'])
+
+            # 최적화 결과 분석 - 조합별 analyze_results 호출 대신 일괄 처리
+            strat_runs = [run[0] for run in opt_results]
+            try:
+                final_results = engine.analyze_results_batch(strat_runs)
+                for analysis, strat in zip(final_results, strat_runs):
+                    analysis['params'] = {k: getattr(strat.params, k)
+                                          for k in param_keys}
+                    # 백테스트 기간 정보 추가
+                    analysis['period'] = period_str
+            except Exception as analyze_error:
+                print(f"⚠️ 결과 분석 실패: {analyze_error}")
+                final_results = []
+
+    return final_results
+
+
 def execute_optimization(configs):
     """최적화를 실행합니다."""
     if isinstance(configs, dict):
         # 단일 config인 경우
         configs = [configs]
-    
+
     print(f"\n=== 최적화 실행 중... (총 {len(configs)}개 조합) ===")
-    
-    all_results = []
-    
-    for i, config in enumerate(configs, 1):
-        print(f"\n{Fore.CYAN}[{i}/{len(configs)}] "
-              f"{config['common']['symbol']} {config['common']['timeframe']} "
-              f"최적화 중...{Style.RESET_ALL}")
-        
-        try:
-            # 데이터 준비
-            data_factory = DataFactory()
-            data_feed = data_factory.get_data_feed(
-                symbol=config['common']['symbol'],
-                timeframe=config['common']['timeframe'],
-                start_date=config['common']['start_date'],
-                end_date=config['common']['end_date']
-            )
-            
-            # 최적화 엔진 설정 및 실행
-            engine = BacktestEngine(config)
-            engine.add_data(data_feed)
-            
-            # 전략 추가
-            strategy_class = getattr(strategies, 
-                                   config['optimization']['strategy'])
-            engine.add_optimizer(strategy_class, 
-                               config['optimization']['params_to_optimize'])
-            
-            print("🔄 최적화 실행 중...")
-            opt_results = engine.run()
-            
-            if opt_results:
-                print(f"✅ 최적화 완료: {len(opt_results)}개 조합 테스트")
-                
-                # 최적화 결과 분석
-                final_results = []
-                for run in opt_results:
-                    try:
-                        analysis = engine.analyze_results(run[0])
-                        params = run[0].params.__dict__
-                        analysis['params'] = params
-                        analysis['symbol'] = config['common']['symbol']
-                        analysis['timeframe'] = config['common']['timeframe']
-                        
-                        # 백테스트 기간 정보 추가
-                        period_str = f"{config['common']['start_date']} ~ {config['common']['end_date']}"
-                        analysis['period'] = period_str
-                        
-                        final_results.append(analysis)
-                    except Exception as analyze_error:
-                        print(f"⚠️ 결과 분석 실패: {analyze_error}")
-                        continue
-                
-                # 최적화 목표 기준으로 정렬
-                optimize_target = config['optimization']['optimize_target']
-                sorted_results = sorted(final_results, 
-                                      key=lambda x: x.get(optimize_target, 0), 
-                                      reverse=True)
-                
-                # 상위 5개 결과 출력
-                print(f"\n🏆 {optimize_target} 기준 상위 5개 결과:")
-                for rank, result in enumerate(sorted_results[:5], 1):
-                    target_value = result.get(optimize_target, 0)
-                    print(f"  Rank {rank}: {target_value:.2f}")
-                    print(f"    Params: {result['params']}")
-                    print(f"    Return: {result.get('total_return_pct', 0):.2f}%")
-                    print(f"    Sharpe: {result.get('sharpe_ratio', 0):.2f}")
-                    print("-" * 30)
-                
-                all_results.extend(sorted_results)
-                
+
+    # 전체 결과를 메모리에 쌓지 않고, 요약 테이블에 필요한 상위 K개와
+    # 스칼라 집계만 유지 (전체 행은 아래 Parquet으로 이미 스트리밍됨)
+    TOP_K = 10
+    top_heap = []  # (지표값, 일련번호, analysis) 최소 힙 - 크기 K 고정
+    seq = itertools.count()
+    totals = {'count': 0, 'profitable': 0,
+              'worst_metric': None, 'worst_return': None}
+
+    # 결과를 Parquet으로 스트리밍 기록 (크래시에도 안전, 사후 분석용)
+    paths_cfg = configs[0].get('results_path', {})
+    result_writer = OptResultWriter(os.path.join(
+        paths_cfg.get('base', 'results'),
+        paths_cfg.get('optimization', 'optimization'),
+        'opt_results.parquet'))
+
+    def _consume(config, final_results):
+        """config 하나의 결과를 기록하고 상위 5개를 출력합니다."""
+        if not final_results:
+            print("❌ 최적화 결과가 없습니다")
+            return
+
+        optimize_target = config['optimization']['optimize_target']
+        for analysis in final_results:
+            result_writer.write(analysis)
+
+            # 스윕 전체 집계는 O(1) 스칼라 + 크기 K 힙으로만 유지
+            metric = analysis.get(optimize_target) or 0
+            return_pct = analysis.get('total_return_pct') or 0
+            totals['count'] += 1
+            if return_pct > 0:
+                totals['profitable'] += 1
+            if totals['worst_metric'] is None or metric < totals['worst_metric']:
+                totals['worst_metric'] = metric
+                totals['worst_return'] = return_pct
+
+            item = (metric, next(seq), analysis)
+            if len(top_heap) < TOP_K:
+                heapq.heappush(top_heap, item)
             else:
-                print("❌ 최적화 결과가 없습니다")
-                
-        except Exception as e:
-            print(f"{Fore.RED}❌ 오류: {e}{Style.RESET_ALL}")
-    
-    # 전체 결과 요약
-    if all_results:
+                heapq.heappushpop(top_heap, item)
+
+        # 상위 5개만 필요하므로 전체 정렬 대신 O(K log 5) 힙 선택
+        top_results = heapq.nlargest(5, final_results,
+                                     key=lambda x: x.get(optimize_target, 0))
+
+        # 상위 5개 결과 출력
+        print(f"\n🏆 {optimize_target} 기준 상위 5개 결과:")
+        for rank, result in enumerate(top_results, 1):
+            target_value = result.get(optimize_target, 0)
+            print(f"  Rank {rank}: {target_value:.2f}")
+            print(f"    Params: {result['params']}")
+            print(f"    Return: {result.get('total_return_pct', 0):.2f}%")
+            print(f"    Sharpe: {result.get('sharpe_ratio', 0):.2f}")
+            print("-" * 30)
+
+    # config 간 공유 상태가 없으므로 (심볼×타임프레임) 수준에서 프로세스
+    # 병렬 실행이 가능. search: pool은 워커 안에서 또 Pool을 띄우고,
+    # bayesian/optstrategy는 내부적으로 코어를 쓰므로 순차 경로를 유지.
+    opt_cfg0 = configs[0].get('optimization', {})
+    parallel = (len(configs) > 1
+                and opt_cfg0.get('parallel_configs', True)
+                and opt_cfg0.get('search') not in ('pool', 'bayesian'))
+
+    if parallel:
+        # 워커 내부 Cerebro는 maxcpus=1로 고정해 코어 초과 구독 방지
+        max_workers = min(len(configs), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(_run_config, config, 1): config
+                       for config in configs}
+            for i, fut in enumerate(concurrent.futures.as_completed(futures), 1):
+                config = futures[fut]
+                print(f"\n{Fore.CYAN}[{i}/{len(configs)}] "
+                      f"{config['common']['symbol']} {config['common']['timeframe']} "
+                      f"완료{Style.RESET_ALL}")
+                try:
+                    _consume(config, fut.result())
+                except Exception as e:
+                    print(f"{Fore.RED}❌ 오류: {e}{Style.RESET_ALL}")
+    else:
+        for i, config in enumerate(configs, 1):
+            print(f"\n{Fore.CYAN}[{i}/{len(configs)}] "
+                  f"{config['common']['symbol']} {config['common']['timeframe']} "
+                  f"최적화 중...{Style.RESET_ALL}")
+
+            try:
+                _consume(config, _run_config(config))
+            except Exception as e:
+                print(f"{Fore.RED}❌ 오류: {e}{Style.RESET_ALL}")
+
+    result_writer.close()
+    if result_writer.enabled and result_writer.path:
+        print(f"📁 전체 최적화 결과 저장: {result_writer.path}")
+
+    # 전체 결과 요약 (상위 K개 + 스칼라 집계만으로 출력 - 메모리 O(K))
+    if top_heap:
         print(f"\n{Fore.GREEN}=== 전체 최적화 완료 ==={Style.RESET_ALL}")
-        print(f"총 {len(all_results)}개 결과 생성")
-        
+        print(f"총 {totals['count']}개 결과 생성")
+
         # 상세한 최적화 결과 테이블 출력
-        if configs and len(configs) > 0:
-            optimize_target = configs[0]['optimization']['optimize_target']
-            print_optimization_summary(all_results, optimize_target)
+        optimize_target = configs[0]['optimization']['optimize_target']
+        top_results = [item[2] for item in sorted(top_heap, reverse=True)]
+        print_optimization_summary(top_results, optimize_target, totals=totals)
     else:
         print(f"\n{Fore.RED}❌ 최적화 결과가 없습니다{Style.RESET_ALL}")
 
@@ -834,27 +1129,32 @@ def execute_optimization(configs):
 def main():
     # colorama 초기화
     init(autoreset=True)
-    
+
     print("🚀 Backtrader-V3 대화형 최적화 시스템")
     print("=" * 50)
-    
-    # 1. 설정 모드 선택
-    mode = select_config_mode()
-    
-    if mode == '1':
-        # config 파일 사용
-        config = run_optimization_with_config()
-    else:
-        # 수동 설정
-        selected_strategy = select_strategy()
-        symbols = select_symbols()
-        timeframes = select_timeframes()
-        period_config = select_backtest_period()
-        optimization_target = select_optimization_target()
-        configs = run_optimization_manual(symbols, timeframes, 
-                                        period_config, selected_strategy, 
-                                        optimization_target)
-    
+
+    # Ctrl+C는 선택 함수들 대신 여기서 한 번만 처리
+    try:
+        # 1. 설정 모드 선택
+        mode = select_config_mode()
+
+        if mode == '1':
+            # config 파일 사용
+            config = run_optimization_with_config()
+        else:
+            # 수동 설정
+            selected_strategy = select_strategy()
+            symbols = select_symbols()
+            timeframes = select_timeframes()
+            period_config = select_backtest_period()
+            optimization_target = select_optimization_target()
+            configs = run_optimization_manual(symbols, timeframes,
+                                            period_config, selected_strategy,
+                                            optimization_target)
+    except KeyboardInterrupt:
+        print("\n\n프로그램을 종료합니다.")
+        sys.exit(0)
+
     # 2. 최종 설정 확인 및 최적화 실행
     if mode == '1':
         # config 파일 사용 시
@@ -868,7 +1168,7 @@ def main():
             execute_optimization(configs)
         else:
             return
-    
+
     print(f"\n{Fore.GREEN}✅ 최적화가 완료되었습니다!{Style.RESET_ALL}")
 
 
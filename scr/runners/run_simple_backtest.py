@@ -1,35 +1,96 @@
 import yaml
 import os
 import sys
+import types
 import pathlib
-import glob
+import logging
+import argparse
+import functools
+import itertools
+import multiprocessing
+import concurrent.futures
+from multiprocessing import shared_memory
+import numpy as np
 import pandas as pd
-import backtrader as bt
 from datetime import datetime, timedelta
 from colorama import init, Fore, Style
+from tqdm import tqdm
+
+# PyYAML의 C 가속 로더가 있으면 사용 (순수 파이썬 로더 대비 수 배 빠름)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parquet 결과 기록용 (미설치 시 기록만 건너뜀)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# 워커와 주고받는 config/분석 dict는 전부 순수 JSON 타입이라, 중첩 dict에
+# 느린 기본 피클 대신 C 구현 JSON으로 직렬화해 IPC 비용을 줄입니다.
+# orjson 미설치 시 stdlib json으로 폴백 (동작 동일, 속도만 차이).
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, default=str)
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj, default=str).encode()
+
+    _json_loads = json.loads
 
 # 현재 파일의 상위 디렉토리를 Python 경로에 추가
 current_dir = pathlib.Path(__file__).parent.parent.parent
 sys.path.insert(0, str(current_dir))
 
-from scr.core.data import DataFactory
+from scr.core.data import DataFactory, NumpyArrayData
 from scr.core.engine import BacktestEngine
-from scr.core import strategies
+from scr.core import jit, strategies
+
+# 진단 출력은 logger.debug로만 내보냅니다 - 기본(INFO) 레벨에서는
+# isEnabledFor 정수 비교 한 번으로 끝나 스윕 핫루프에 문자열 생성도
+# write() 시스콜도 없습니다. 필요하면 LOGLEVEL=DEBUG로 켜세요.
+log = logging.getLogger(__name__)
+
+
+DATA_DIR = "data/ohlcv"
+
+
+@functools.lru_cache(maxsize=4)
+def _ohlcv_entries(mtime_ns):
+    """DATA_DIR의 CSV 목록을 (파일명, 경로) 튜플로 반환합니다.
+
+    os.scandir는 glob.glob과 달리 항목마다 stat을 부르지 않아 디렉터리를
+    한 번만 훑습니다. 디렉터리 mtime을 캐시 키로 써서 파일이 추가/삭제되면
+    자동으로 다시 스캔합니다.
+    """
+    with os.scandir(DATA_DIR) as it:
+        return tuple(sorted((e.name, e.path) for e in it
+                            if e.name.endswith('.csv')))
+
+
+def _list_ohlcv_files():
+    """캐시된 OHLCV CSV 목록을 반환합니다 (폴더가 없으면 빈 튜플)."""
+    try:
+        mtime_ns = os.stat(DATA_DIR).st_mtime_ns
+    except OSError:
+        return ()
+    return _ohlcv_entries(mtime_ns)
 
 
 def get_available_symbols():
     """data/ohlcv 폴더에서 사용 가능한 종목들을 가져옵니다."""
-    data_dir = "data/ohlcv"
-    symbols = set()
-    
-    if os.path.exists(data_dir):
-        for file_path in glob.glob(f"{data_dir}/*.csv"):
-            filename = os.path.basename(file_path)
-            # 파일명에서 종목명 추출 (예: BTCUSDT_1d.csv -> BTCUSDT)
-            symbol = filename.split('_')[0]
-            symbols.add(symbol)
-    
-    return sorted(list(symbols))
+    # 파일명에서 종목명 추출 (예: BTCUSDT_1d.csv -> BTCUSDT)
+    return sorted({name.partition('_')[0] for name, _ in _list_ohlcv_files()})
 
 
 def get_available_timeframes():
@@ -38,21 +99,12 @@ def get_available_timeframes():
 
 
 def get_available_strategies():
-    """strategies.py에서 사용 가능한 전략들을 가져옵니다."""
-    try:
-        # strategies 모듈에서 Strategy 클래스들을 찾기
-        strategy_classes = []
-        for attr_name in dir(strategies):
-            attr = getattr(strategies, attr_name)
-            if (isinstance(attr, type) and 
-                issubclass(attr, bt.Strategy) and 
-                attr != bt.Strategy):
-                strategy_classes.append(attr_name)
-        
-        return sorted(strategy_classes)
-    except Exception:
-        # 오류 발생 시 기본 전략만 반환
-        return ['SmaCrossStrategy']
+    """사용 가능한 전략 이름들을 가져옵니다.
+
+    dir() 스캔 + issubclass 검사 대신 strategies.py의 명시적
+    STRATEGY_REGISTRY(@register 데코레이터로 채워짐)를 읽습니다.
+    """
+    return sorted(strategies.STRATEGY_REGISTRY)
 
 
 def select_strategy():
@@ -248,13 +300,31 @@ def select_backtest_period():
             sys.exit(0)
 
 
+CONFIG_PATH = "config/main_config.yaml"
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_main_config(mtime_ns):
+    """main_config.yaml을 파싱합니다 (파일 mtime 키 캐시)."""
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_main_config():
+    """캐시된 메인 설정을 반환합니다 (파일이 바뀌면 자동 재파싱).
+
+    기간/전략 폴백 등 여러 곳에서 설정을 다시 읽기 때문에, 실행당
+    YAML 파싱은 한 번만 일어나도록 여기로 일원화합니다.
+    """
+    return _parse_main_config(os.stat(CONFIG_PATH).st_mtime_ns)
+
+
 def run_backtest_with_config():
     """config 파일을 사용하여 백테스트를 실행합니다."""
     print("\n=== config 파일을 사용한 백테스트 ===")
-    
+
     try:
-        with open("config/main_config.yaml", 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = load_main_config()
 
         common_cfg = config['common']
         simple_cfg = config['simple_backtest']
@@ -266,17 +336,19 @@ def run_backtest_with_config():
             print(f"기간: {common_cfg['start_date']} ~ {common_cfg['end_date']}")
             print(f"전략: {simple_cfg['strategy']}")
             
-            # 모든 조합에 대한 config 리스트 생성
-            configs = []
-            for symbol in common_cfg['symbols']:
-                for timeframe in common_cfg['timeframes']:
-                    # 기존 config를 복사하고 symbol, timeframe만 변경
-                    config_copy = config.copy()
-                    config_copy['common'] = config_copy['common'].copy()
-                    config_copy['common']['symbol'] = symbol
-                    config_copy['common']['timeframe'] = timeframe
-                    configs.append(config_copy)
-            
+            # 모든 조합에 대한 config 리스트 생성.
+            # 조합마다 달라지는 건 common의 symbol/timeframe 두 필드뿐이므로
+            # simple_backtest/results_path 등 나머지 서브트리는 복사하지 않고
+            # 공유합니다 - N개 config가 dict 두 개짜리 오버레이만 새로 가지며
+            # 워커로 보내는 피클 페이로드도 그만큼 작아집니다.
+            configs = [
+                {**config,
+                 'common': {**common_cfg,
+                            'symbol': symbol, 'timeframe': timeframe}}
+                for symbol, timeframe in itertools.product(
+                    common_cfg['symbols'], common_cfg['timeframes'])
+            ]
+
             return configs
         else:
             # 기존 단일 설정 사용
@@ -308,77 +380,77 @@ def run_backtest_manual(symbols, timeframes, period_config, selected_strategy):
     
     # 전략별 기본 파라미터 설정
     strategy_params = get_strategy_default_params(selected_strategy)
-    
-    # 모든 조합에 대한 config 리스트 생성
-    configs = []
-    
-    for symbol in symbols:
-        for timeframe in timeframes:
-            config = {
-                'common': {
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'initial_cash': 1000.0,
-                    'commission': 0.0015
-                },
-                'simple_backtest': {
-                    'strategy': selected_strategy,
-                    'params': strategy_params
-                },
-                'results_path': {
-                    'base': 'results',
-                    'simple': 'simple',
-                    'optimization': 'optimization',
-                    'walk_forward': 'walk_forward'
-                }
-            }
-            configs.append(config)
-    
+
+    # 모든 조합에 대한 config 리스트 생성 - 공유 서브트리는 한 번만 만들고
+    # 조합마다 symbol/timeframe 오버레이만 새로 만듭니다.
+    base_common = {
+        'start_date': start_date,
+        'end_date': end_date,
+        'initial_cash': 1000.0,
+        'commission': 0.0015
+    }
+    shared_simple = {
+        'strategy': selected_strategy,
+        'params': strategy_params
+    }
+    shared_paths = {
+        'base': 'results',
+        'simple': 'simple',
+        'optimization': 'optimization',
+        'walk_forward': 'walk_forward'
+    }
+    configs = [
+        {'common': {**base_common, 'symbol': symbol, 'timeframe': timeframe},
+         'simple_backtest': shared_simple,
+         'results_path': shared_paths}
+        for symbol, timeframe in itertools.product(symbols, timeframes)
+    ]
+
     return configs
 
 
+# 전략별 기본 파라미터 - 호출마다 dict 리터럴을 새로 만드는 대신 읽기
+# 전용 맵 하나를 모듈 레벨에 고정해 둡니다 (MappingProxyType이라 실수로
+# 공유 기본값을 변경하는 것도 차단).
+_DEFAULT_PARAMS = types.MappingProxyType({
+    'SmaCrossStrategy': types.MappingProxyType({
+        'fast_ma': 20,
+        'slow_ma': 50
+    }),
+    'MACD_LinePeakStrategy': types.MappingProxyType({
+        'p_fast1': 5,
+        'p_slow1': 20,
+        'p_fast2': 5,
+        'p_slow2': 40,
+        'p_fast3': 20,
+        'p_slow3': 40,
+        'p_signal': 9,
+        'debug': True
+    }),
+    'MACD_LinePeakStrategy_v2': types.MappingProxyType({
+        'p_fast1': 5,
+        'p_slow1': 20,
+        'p_fast2': 5,
+        'p_slow2': 40,
+        'p_fast3': 20,
+        'p_slow3': 40,
+        'p_signal': 9,
+        # 리스크 관리 파라미터
+        'risk_pct': 1.0,        # 거래당 1% 리스크
+        'sl_mode': 'ATR',       # ATR 기반 스톱로스
+        'atr_len': 14,          # ATR 14기간
+        'atr_mult': 2.0,        # ATR 2배수
+        'sl_percent': 1.5,      # 1.5% 퍼센트 스톱로스
+        'sl_ticks': 50,         # 50틱 스톱로스
+        'min_qty': 0.0001,      # 최소 주문량
+        'debug': True
+    }),
+})
+
+
 def get_strategy_default_params(strategy_name):
-    """전략별 기본 파라미터를 반환합니다."""
-    if strategy_name == 'SmaCrossStrategy':
-        return {
-            'fast_ma': 20,
-            'slow_ma': 50
-        }
-    elif strategy_name == 'MACD_LinePeakStrategy':
-        return {
-            'p_fast1': 5,
-            'p_slow1': 20,
-            'p_fast2': 5,
-            'p_slow2': 40,
-            'p_fast3': 20,
-            'p_slow3': 40,
-            'p_signal': 9,
-            'debug': True
-        }
-    elif strategy_name == 'MACD_LinePeakStrategy_v2':
-        return {
-            'p_fast1': 5,
-            'p_slow1': 20,
-            'p_fast2': 5,
-            'p_slow2': 40,
-            'p_fast3': 20,
-            'p_slow3': 40,
-            'p_signal': 9,
-            # 리스크 관리 파라미터
-            'risk_pct': 1.0,        # 거래당 1% 리스크
-            'sl_mode': 'ATR',       # ATR 기반 스톱로스
-            'atr_len': 14,          # ATR 14기간
-            'atr_mult': 2.0,        # ATR 2배수
-            'sl_percent': 1.5,      # 1.5% 퍼센트 스톱로스
-            'sl_ticks': 50,         # 50틱 스톱로스
-            'min_qty': 0.0001,      # 최소 주문량
-            'debug': True
-        }
-    else:
-        # 기본값
-        return {}
+    """전략별 기본 파라미터를 반환합니다 (수정 가능한 사본)."""
+    return dict(_DEFAULT_PARAMS.get(strategy_name, {}))
 
 
 def get_period_dates(period_config):
@@ -402,8 +474,7 @@ def get_period_dates(period_config):
     else:  # default
         # 기본설정: config 파일 사용
         try:
-            with open("config/main_config.yaml", 'r', encoding='utf-8') as f:
-                config_from_file = yaml.safe_load(f)
+            config_from_file = load_main_config()
             start_date = config_from_file['common']['start_date']
             end_date = config_from_file['common']['end_date']
             return start_date, end_date
@@ -412,187 +483,482 @@ def get_period_dates(period_config):
             return '2024-01-01', '2025-01-01'
 
 
+@functools.lru_cache(maxsize=4)
+def _scan_data_period(sample_file, mtime_ns):
+    """샘플 CSV의 (시작일, 종료일)을 헤더/꼬리만 읽어 알아냅니다.
+
+    OHLCV CSV는 시간순으로 정렬돼 있으므로 첫 데이터 행과 파일 끝
+    바이트 범위만 읽으면 충분합니다 - 수백만 행 파일도 전체 파싱 없이
+    O(1) I/O로 끝납니다. mtime_ns를 캐시 키에 포함해 파일이 갱신되면
+    자동으로 다시 읽습니다.
+    """
+    try:
+        with open(sample_file, 'rb') as f:
+            header = f.readline().decode('utf-8').strip().split(',')
+            if 'timestamp' not in header:
+                return None
+            ts_idx = header.index('timestamp')
+
+            first_row = f.readline().decode('utf-8').strip().split(',')
+
+            # 마지막 행: 파일 끝 8KB만 읽어 마지막 완전한 행을 취함
+            try:
+                f.seek(-8192, os.SEEK_END)
+            except OSError:
+                f.seek(0)  # 8KB보다 작은 파일
+            last_row = f.read().splitlines()[-1].decode('utf-8').strip().split(',')
+
+        start_dt = datetime.fromisoformat(first_row[ts_idx])
+        end_dt = datetime.fromisoformat(last_row[ts_idx])
+        return start_dt.strftime('%Y-%m-%d'), end_dt.strftime('%Y-%m-%d')
+
+    except (ValueError, IndexError, OSError):
+        # 폴백: timestamp 컬럼만 줄 단위로 훑어 min/max 계산.
+        # 두 날짜를 얻으려고 pandas의 타입 추론/블록 매니저를 태울 필요가
+        # 없으므로 stdlib csv + fromisoformat(C 구현)으로 처리합니다.
+        import csv
+
+        start_dt = end_dt = None
+        with open(sample_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            ts_idx = next(reader).index('timestamp')
+            for row in reader:
+                try:
+                    dt = datetime.fromisoformat(row[ts_idx])
+                except (ValueError, IndexError):
+                    continue  # 깨진 행은 건너뜀
+                if start_dt is None or dt < start_dt:
+                    start_dt = dt
+                if end_dt is None or dt > end_dt:
+                    end_dt = dt
+
+        if start_dt is None:
+            return None
+        return start_dt.strftime('%Y-%m-%d'), end_dt.strftime('%Y-%m-%d')
+
+
 def get_actual_data_period():
     """실제 데이터 파일에서 사용 가능한 기간을 확인합니다."""
     try:
         # data/ohlcv 폴더에서 첫 번째 CSV 파일을 찾아서 기간 확인
-        data_dir = "data/ohlcv"
-        if os.path.exists(data_dir):
-            csv_files = glob.glob(f"{data_dir}/*.csv")
-            if csv_files:
-                # 첫 번째 파일로 기간 확인
-                sample_file = csv_files[0]
-                df = pd.read_csv(sample_file)
-                
-                if 'timestamp' in df.columns:
-                    # timestamp 컬럼을 datetime으로 변환
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
-                    
-                    # 시작일과 종료일 추출
-                    start_date = df['timestamp'].min().strftime('%Y-%m-%d')
-                    end_date = df['timestamp'].max().strftime('%Y-%m-%d')
-                    
-                    return start_date, end_date
-        
+        entries = _list_ohlcv_files()
+        if entries:
+            sample_file = entries[0][1]
+            period = _scan_data_period(sample_file,
+                                       os.stat(sample_file).st_mtime_ns)
+            if period:
+                return period
+
         # 기본값 반환 (데이터 파일을 찾을 수 없는 경우)
         return '2024-01-01', '2025-01-01'
-        
+
     except Exception:
         # 오류 발생 시 기본값 반환
         return '2024-01-01', '2025-01-01'
 
 
+# 프로세스당 하나의 DataFactory만 두고 피드를 (종목, 타임프레임, 기간)
+# 키로 메모이즈 - 같은 데이터를 쓰는 config가 여럿이어도 CSV 파싱과
+# 배열 변환은 한 번만 수행됨. NumpyArrayData는 start()에서 커서를
+# 리셋하므로 같은 피드 객체를 여러 Cerebro 실행에 재사용해도 안전함.
+_data_factory = DataFactory()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_feed(symbol, timeframe, start_date, end_date):
+    """캐시된 Backtrader 데이터 피드를 반환합니다."""
+    return _data_factory.get_data_feed(
+        symbol=symbol,
+        timeframe=timeframe,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+
+def _extract_analysis(strategy_result, config):
+    """비교 테이블이 실제로 쓰는 지표만 분석기에서 바로 뽑습니다.
+
+    engine.analyze_results는 단순 실행용 전체 요약(initial/final_value 포함)
+    을 만들지만, 스윕 경로는 테이블에 렌더링되는 키만 필요하므로 각
+    분석기의 get_analysis()를 직접 읽어 쓰지 않는 필드 계산을 생략합니다.
+    """
+    common = config['common']
+    analyzers = strategy_result.analyzers
+    initial_cash = common['initial_cash']
+
+    if hasattr(strategy_result, 'broker'):
+        final_value = strategy_result.broker.getvalue()
+    else:
+        # OptReturn: broker가 없으므로 Returns 분석기로 복원
+        rtot = analyzers.returns.get_analysis().get('rtot', 0.0)
+        final_value = initial_cash * (1 + rtot)
+
+    trade_info = analyzers.trade_analyzer.get_analysis()
+    won_info = trade_info.get('won', {})
+    lost_info = trade_info.get('lost', {})
+    total_trades = trade_info.get('total', {}).get('total', 0)
+    won_trades = won_info.get('total', 0)
+    gross_profit = won_info.get('pnl', {}).get('total', 0)
+    gross_loss = abs(lost_info.get('pnl', {}).get('total', 0))
+
+    return {
+        'symbol': common['symbol'],
+        'timeframe': common['timeframe'],
+        'period': f"{common['start_date']} ~ {common['end_date']}",
+        'total_return_pct': (final_value / initial_cash - 1) * 100,
+        'sharpe_ratio':
+            analyzers.sharpe_ratio.get_analysis().get('sharperatio', 0),
+        'max_drawdown_pct':
+            analyzers.drawdown.get_analysis().get('max', {}).get('drawdown', 0),
+        'total_trades': total_trades,
+        'win_rate_pct':
+            (won_trades / total_trades * 100) if total_trades else 0.0,
+        'profit_factor':
+            (gross_profit / gross_loss) if gross_loss > 0 else 0,
+    }
+
+
+def _run_one(config):
+    """단일 (종목, 타임프레임) 조합을 백테스트하고 분석 dict를 반환합니다.
+
+    ProcessPoolExecutor 워커로 보내지므로 모듈 최상위에 있어야 피클링이
+    가능합니다. 워커에서 stdout을 어지럽히지 않도록 진행 출력은 하지 않고,
+    실패 시 'error' 키가 포함된 dict를 돌려줍니다.
+    """
+    common = config['common']
+    log.debug("config 구조: common=%s simple_backtest=%s",
+              list(common), list(config.get('simple_backtest', {})))
+    try:
+        # 데이터 준비 - 부모가 공유 메모리에 올려 둔 배열이 있으면 attach,
+        # 없으면 프로세스 내 캐시 경로 (재파싱 없음)
+        shm_spec = config.get('_shm_feed')
+        if shm_spec:
+            data_feed = _attach_shared_feed(shm_spec)
+        else:
+            data_feed = _get_feed(*_feed_key(config))
+
+        # 백테스트 엔진 설정 및 실행
+        engine = BacktestEngine(config)
+        engine.add_data(data_feed)
+
+        strategy_name = _strategy_name(config)
+        strategy_class = getattr(strategies, strategy_name)
+        engine.add_strategy(strategy_class,
+                            config['simple_backtest']['params'])
+        log.debug("전략 %s 실행: %s %s", strategy_name,
+                  common['symbol'], common['timeframe'])
+
+        results = engine.run()
+        log.debug("engine.run() 완료: %d개 결과", len(results) if results else 0)
+        if not results:
+            raise RuntimeError("백테스트 결과 없음")
+
+        analysis = _extract_analysis(results[0], config)
+        analysis['strategy'] = strategy_name
+        return analysis
+
+    except Exception as e:
+        # 오류 발생 시 기본 결과 반환 (테이블의 ERROR 행으로 표시됨)
+        log.debug("백테스트 실패 (%s %s): %s",
+                  common['symbol'], common['timeframe'], e)
+        return {
+            'symbol': common['symbol'],
+            'timeframe': common['timeframe'],
+            'error': str(e)
+        }
+
+
+def _feed_key(config):
+    """피드 캐시/공유 메모리 스테이징에 쓰는 (심볼, TF, 기간) 키."""
+    common = config['common']
+    return (common['symbol'], common['timeframe'],
+            str(common['start_date']), str(common['end_date']))
+
+
+def _stage_shared_feeds(configs):
+    """고유 피드별 OHLCV 배열을 공유 메모리에 한 번만 올립니다.
+
+    풀 워커가 각자 CSV를 다시 파싱하는 대신 부모가 만든 (6, n) float64
+    블록(datetime/open/high/low/close/volume)에 이름으로 attach해 O(1)에
+    배열 뷰를 복원합니다. N번의 디스크 읽기가 1번이 됩니다.
+
+    반환: (키→spec dict, 부모가 정리해야 할 SharedMemory 핸들 리스트).
+    적재에 실패한 키는 spec에서 빠지며 워커가 기존 경로로 폴백합니다.
+    """
+    specs = {}
+    handles = []
+    for config in configs:
+        key = _feed_key(config)
+        if key in specs:
+            continue
+        try:
+            feed = _get_feed(*key)
+            block = np.stack([feed._arr_datetime, feed._arr_open,
+                              feed._arr_high, feed._arr_low,
+                              feed._arr_close, feed._arr_volume])
+            shm = shared_memory.SharedMemory(create=True, size=block.nbytes)
+            np.ndarray(block.shape, block.dtype, buffer=shm.buf)[:] = block
+            handles.append(shm)
+            specs[key] = {'name': shm.name, 'rows': int(block.shape[1])}
+        except Exception as e:
+            log.debug("공유 메모리 스테이징 실패 (%s): %s", key, e)
+    return specs, handles
+
+
+# 워커가 attach한 공유 메모리 피드 캐시. SharedMemory 핸들을 같이 보관해야
+# 버퍼가 GC로 해제되지 않음 (배열은 버퍼의 뷰일 뿐이므로).
+_shm_feeds = {}
+
+
+def _attach_shared_feed(spec):
+    """워커에서 공유 메모리 블록에 attach해 데이터 피드를 만듭니다."""
+    name = spec['name']
+    if name not in _shm_feeds:
+        shm = shared_memory.SharedMemory(name=name)
+        block = np.ndarray((6, spec['rows']), dtype=np.float64,
+                           buffer=shm.buf)
+        feed = NumpyArrayData(arrays=tuple(block))
+        _shm_feeds[name] = (shm, feed)
+    return _shm_feeds[name][1]
+
+
+def _run_one_bytes(config_bytes):
+    """JSON 바이트로 받은 config를 실행하고 결과를 JSON 바이트로 돌려줍니다.
+
+    프로세스 풀 경계를 넘는 페이로드를 피클 대신 JSON으로 직렬화하기 위한
+    _run_one의 얇은 래퍼입니다.
+    """
+    return _json_dumps(_run_one(_json_loads(config_bytes)))
+
+
+def _strategy_name(config):
+    """config에서 전략 이름을 찾습니다 (common 우선)."""
+    return (config['common'].get('strategy')
+            or config.get('simple_backtest', {}).get('strategy')
+            or 'SmaCrossStrategy')
+
+
+def _group_key(config):
+    """같은 데이터 피드와 전략을 공유하는 config들의 그룹 키."""
+    common = config['common']
+    return (common['symbol'], common['timeframe'],
+            str(common['start_date']), str(common['end_date']),
+            _strategy_name(config))
+
+
+def _run_fused(group):
+    """파라미터만 다른 config 묶음을 단일 optstrategy 실행으로 융합합니다.
+
+    N개의 독립 Cerebro 대신 데이터 피드를 한 번만 올리고 backtrader가
+    조합을 코어별로 병렬 실행하게 합니다. optstrategy는 파라미터별 후보값
+    리스트의 곱집합을 돌리므로, 묶음의 조합들이 완전한 그리드를 이룰 때만
+    융합하고 아니면 조합별 실행으로 폴백합니다 (피드는 캐시돼 있어 폴백도
+    데이터 적재는 한 번).
+    """
+    common = group[0]['common']
+    strategy_name = _strategy_name(group[0])
+
+    param_sets = [c['simple_backtest']['params'] for c in group]
+    keys = sorted(param_sets[0])
+    # 키 집합이 어긋난 config가 있으면 아래 uniques/combos 구성이
+    # KeyError를 내므로, 그리드 판정 전에 먼저 확인하고 폴백
+    if any(sorted(p) != keys for p in param_sets):
+        return [_run_one(c) for c in group]
+
+    uniques = [sorted({p[k] for p in param_sets}, key=repr) for k in keys]
+    combos = {tuple(p[k] for k in keys) for p in param_sets}
+    full_grid = (len(combos) == len(group)
+                 and combos == set(itertools.product(*uniques)))
+    if not full_grid:
+        return [_run_one(c) for c in group]
+
+    try:
+        data_feed = _get_feed(common['symbol'], common['timeframe'],
+                              str(common['start_date']),
+                              str(common['end_date']))
+        engine = BacktestEngine(group[0])
+        engine.add_data(data_feed)
+        strategy_class = getattr(strategies, strategy_name)
+        # add_optimizer는 3원소 리스트를 range로 해석하므로 후보값 리스트는
+        # optstrategy에 직접 전달
+        engine.cerebro.optstrategy(strategy_class,
+                                   **dict(zip(keys, uniques)))
+        results = engine.run()
+
+        analyses = []
+        for run in results:
+            strat = run[0]
+            analysis = _extract_analysis(strat, group[0])
+            analysis['strategy'] = strategy_name
+            analysis['params'] = {k: getattr(strat.params, k) for k in keys}
+            analyses.append(analysis)
+        return analyses
+
+    except Exception as e:
+        return [{'symbol': common['symbol'],
+                 'timeframe': common['timeframe'],
+                 'error': str(e)} for _ in group]
+
+
+class BacktestResultWriter:
+    """백테스트 결과를 Parquet 파일에 행 단위로 스트리밍 기록합니다.
+
+    결과를 리스트에만 쌓으면 긴 스윕 도중 프로세스가 죽었을 때 전부
+    사라지므로, 조합 하나가 끝날 때마다 바로 디스크에 내보냅니다.
+    컬럼 지향 파일이라 사후 분석(pandas/pyarrow)도 바로 가능합니다.
+    pyarrow 미설치 시에는 조용히 no-op으로 동작합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._writer = None
+        self.enabled = pa is not None
+
+    def write(self, analysis):
+        if not self.enabled or 'error' in analysis:
+            return
+        try:
+            # params 딕셔너리는 문자열로 평탄화해 고정 스키마를 유지
+            row = {k: [v] for k, v in analysis.items()
+                   if not isinstance(v, dict)}
+            row['params'] = [repr(analysis.get('params', {}))]
+            batch = pa.RecordBatch.from_pydict(row)
+            if self._writer is None:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                self._writer = pq.ParquetWriter(self.path, batch.schema)
+            self._writer.write_batch(batch)
+        except Exception as e:
+            # 결과 기록 실패가 백테스트 자체를 중단시키면 안 됨
+            print(f"⚠️ Parquet 결과 기록 비활성화: {e}")
+            self.enabled = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            print(f"📁 백테스트 결과 저장: {self.path}")
+
+
 def execute_backtest(configs):
-    """백테스트를 실행합니다."""
+    """백테스트를 실행합니다.
+
+    조합이 여러 개면 프로세스 풀로 병렬 실행합니다. 각 조합은 독립적인
+    데이터 피드와 BacktestEngine을 사용하므로(공유 상태 없음) 코어 수에
+    가깝게 선형으로 빨라집니다. 완료된 결과는 그때그때 Parquet으로
+    기록됩니다.
+    """
     if isinstance(configs, dict):
         # 단일 config인 경우
         configs = [configs]
-    
+
     print(f"\n=== 백테스트 실행 중... (총 {len(configs)}개 조합) ===")
-    
+
+    paths = configs[0].get('results_path', {})
+    writer = BacktestResultWriter(os.path.join(
+        paths.get('base', 'results'),
+        paths.get('simple', 'simple'),
+        'backtest_results.parquet'))
+
     all_results = []
-    
-    for i, config in enumerate(configs, 1):
-        print(f"\n{Fore.CYAN}[{i}/{len(configs)}] {config['common']['symbol']} {config['common']['timeframe']} 실행 중...{Style.RESET_ALL}")
-        
+
+    # 같은 (데이터, 전략)을 공유하고 파라미터만 다른 config들은 하나의
+    # optstrategy 실행으로 융합 - 데이터 적재 1회 + backtrader 자체 병렬화
+    groups = {}
+    for config in configs:
+        groups.setdefault(_group_key(config), []).append(config)
+    fused = [g for g in groups.values() if len(g) > 1]
+    singles = [g[0] for g in groups.values() if len(g) == 1]
+
+    if len(singles) > 1:
+        # 피드를 부모에서 한 번만 적재해 공유 메모리로 게시 - 워커는 CSV를
+        # 다시 파싱하지 않고 이름으로 attach만 함
+        specs, shm_handles = _stage_shared_feeds(singles)
+        payloads = []
+        for config in singles:
+            spec = specs.get(_feed_key(config))
+            payloads.append(dict(config, _shm_feed=spec) if spec else config)
+
+        max_workers = min(len(singles), os.cpu_count() or 1)
         try:
-            # 데이터 준비
-            data_factory = DataFactory()
-            data_feed = data_factory.get_data_feed(
-                symbol=config['common']['symbol'],
-                timeframe=config['common']['timeframe'],
-                start_date=config['common']['start_date'],
-                end_date=config['common']['end_date']
-            )
-            
-            # 백테스트 엔진 설정 및 실행
-            engine = BacktestEngine(config)
-            engine.add_data(data_feed)
-
-            # config 구조 디버깅
-            print("🔍 Config 구조 확인:")
-            print(f"   - common keys: {list(config.get('common', {}).keys())}")
-            print(f"   - simple_backtest keys: "
-                  f"{list(config.get('simple_backtest', {}).keys())}")
-            
-            # 전략 추가 (안전하게)
-            try:
-                if 'strategy' in config.get('common', {}):
-                    strategy_name = config['common']['strategy']
-                elif 'strategy' in config.get('simple_backtest', {}):
-                    strategy_name = config['simple_backtest']['strategy']
-                else:
-                    print("❌ Config에 strategy 정보가 없습니다")
-                    strategy_name = 'SmaCrossStrategy'  # 기본값
-                
-                print(f"🎯 사용할 전략: {strategy_name}")
-                strategy_class = getattr(strategies, strategy_name)
-                engine.add_strategy(strategy_class, 
-                                 config['simple_backtest']['params'])
-                print("✅ 전략 추가 완료")
-            except Exception as strategy_error:
-                print(f"❌ 전략 추가 실패: {strategy_error}")
-                raise strategy_error
-            
-            # 백테스트 실행
-            print("🔄 백테스트 실행 중...")
-            try:
-                results = engine.run()
-                print("✅ engine.run() 완료")
-            except Exception as run_error:
-                print(f"❌ engine.run() 실패: {run_error}")
-                results = None
-            
-            # 디버깅: results 상태 확인
-            print(f"📊 Results 타입: {type(results)}")
-            print(f"📊 Results 길이: {len(results) if results else 'None'}")
-            if results and len(results) > 0:
-                print(f"📊 First result 타입: {type(results[0])}")
-                print(f"📊 First result 내용: {results[0]}")
-            else:
-                print("❌ Results가 비어있거나 None입니다")
-            
-            # 결과 분석
-            if results and len(results) > 0:
-                try:
-                    analysis = engine.analyze_results(results[0])
-                    print("✅ 결과 분석 완료")
-                except Exception as analyze_error:
-                    print(f"❌ 결과 분석 실패: {analyze_error}")
-                    # 기본 분석 결과 생성
-                    analysis = {
-                        'symbol': config['common']['symbol'],
-                        'timeframe': config['common']['timeframe'],
-                        'error': f"분석 실패: {analyze_error}"
-                    }
-            else:
-                print("❌ 백테스트 결과가 없습니다")
-                analysis = {
-                    'symbol': config['common']['symbol'],
-                    'timeframe': config['common']['timeframe'],
-                    'error': "백테스트 결과 없음"
-                }
-            
-            # period 정보와 strategy 정보 추가
-            period_str = f"{config['common']['start_date']} ~ {config['common']['end_date']}"
-            analysis['period'] = period_str
-            
-            # strategy 정보 추가 (안전하게)
-            try:
-                if 'strategy' in config['simple_backtest']:
-                    analysis['strategy'] = config['simple_backtest']['strategy']
-                elif 'strategy' in config['common']:
-                    analysis['strategy'] = config['common']['strategy']
-                else:
-                    analysis['strategy'] = 'Unknown Strategy'
-            except Exception as strategy_error:
-                print(f"⚠️ Strategy 정보 추가 실패: {strategy_error}")
-                analysis['strategy'] = 'Unknown Strategy'
-            
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers) as ex:
+                futures = [ex.submit(_run_one_bytes, _json_dumps(config))
+                           for config in payloads]
+                for future in tqdm(concurrent.futures.as_completed(futures),
+                                   total=len(futures), desc="백테스트"):
+                    analysis = _json_loads(future.result())
+                    writer.write(analysis)
+                    all_results.append(analysis)
+        finally:
+            for shm in shm_handles:
+                shm.close()
+                shm.unlink()
+    else:
+        for i, config in enumerate(singles, 1):
+            common = config['common']
+            print(f"\n{Fore.CYAN}[{i}/{len(singles)}] {common['symbol']} "
+                  f"{common['timeframe']} 실행 중...{Style.RESET_ALL}")
+            analysis = _run_one(config)
+            writer.write(analysis)
             all_results.append(analysis)
-            
-            print(f"{Fore.GREEN}✅ 완료{Style.RESET_ALL}")
-                
-        except Exception as e:
-            print(f"{Fore.RED}❌ 오류: {e}{Style.RESET_ALL}")
-            # 오류 발생 시 기본 결과 추가
-            all_results.append({
-                'symbol': config['common']['symbol'],
-                'timeframe': config['common']['timeframe'],
-                'error': str(e)
-            })
-    
+
+    # 융합 그룹은 부모 프로세스에서 실행 - optstrategy가 내부적으로
+    # 코어별 워커를 띄우므로 풀 안에 중첩시키지 않음
+    for group in fused:
+        common = group[0]['common']
+        print(f"\n{Fore.CYAN}{common['symbol']} {common['timeframe']} "
+              f"파라미터 {len(group)}조합 일괄 실행 중...{Style.RESET_ALL}")
+        for analysis in _run_fused(group):
+            writer.write(analysis)
+            all_results.append(analysis)
+
+    writer.close()
+
     # 모든 결과를 테이블 형태로 출력
     print_comparison_table(all_results)
 
 
+@functools.lru_cache(maxsize=128)
+def _period_days(period_str):
+    """'YYYY-MM-DD ~ YYYY-MM-DD' 문자열의 일수를 반환합니다 (파싱 캐시).
+
+    한 스윕의 결과 행들은 대부분 같은 period_str을 공유하므로 날짜 파싱은
+    고유 기간당 한 번만 수행됩니다. 형식이 맞지 않으면 None을 반환합니다.
+    """
+    try:
+        if '~' not in period_str:
+            return None
+        start_date, end_date = period_str.split('~')
+        return (_parse_date(end_date.strip())
+                - _parse_date(start_date.strip())).days
+    except Exception:
+        return None
+
+
+def _parse_date(date_str):
+    """날짜 문자열을 datetime으로 파싱합니다.
+
+    fromisoformat은 C 구현 전용 경로라 strptime보다 수 배 빠르지만
+    '2025-7-01' 같은 비패딩 날짜를 거부하므로 strptime으로 폴백합니다.
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+
+
 def calculate_cagr(total_return_pct, period_str):
-    """연복리 수익률(CAGR)을 계산합니다."""
+    """연복리 수익률(CAGR)을 계산합니다.
+
+    기간 파싱은 _period_days 캐시로, 거듭제곱 연산은 jit.cagr 커널로
+    처리합니다 (numba 미설치 시 순수 파이썬으로 동일하게 동작).
+    """
     try:
-        # period 문자열에서 시작일과 종료일 추출
-        if '~' in period_str:
-            start_date, end_date = period_str.split('~')
-            start_date = start_date.strip()
-            end_date = end_date.strip()
-            
-            # 날짜 파싱
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            # 기간 계산 (년 단위)
-            years = (end_dt - start_dt).days / 365.25
-            
-            if years > 0:
-                # CAGR 공식: (1 + total_return)^(1/years) - 1
-                total_return = total_return_pct / 100
-                cagr = ((1 + total_return) ** (1/years) - 1) * 100
-                return cagr
-            else:
-                return total_return_pct
-        else:
-            # period 정보가 없으면 원래 수익률 반환
+        days = _period_days(period_str)
+        if not days or days <= 0:
+            # 기간 정보가 없으면 원래 수익률 반환
             return total_return_pct
-            
+        return jit.cagr(float(total_return_pct), days / 365.25)
     except Exception:
         # 오류 발생 시 원래 수익률 반환
         return total_return_pct
@@ -600,47 +966,38 @@ def calculate_cagr(total_return_pct, period_str):
 
 def calculate_monthly_trades(total_trades, period_str):
     """월평균 거래수를 계산합니다."""
-    try:
-        # period 문자열에서 시작일과 종료일을 추출
-        if '~' in period_str:
-            start_date, end_date = period_str.split('~')
-            start_date = start_date.strip()
-            end_date = end_date.strip()
-            
-            # 날짜 파싱
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            # 기간 계산 (월 단위)
-            months = (end_dt - start_dt).days / 30.44  # 평균 월 일수
-            
-            if months > 0:
-                # 월평균 거래수 계산
-                monthly_trades = total_trades / months
-                return monthly_trades
-            else:
-                return total_trades
-        else:
-            # period 정보가 없으면 원래 거래수 반환
-            return total_trades
-            
-    except Exception:
-        # 오류 발생 시 원래 거래수 반환
+    days = _period_days(period_str)
+    if not days or days <= 0:
+        # 기간 정보가 없으면 원래 거래수 반환
         return total_trades
+    return total_trades / (days / 30.44)  # 평균 월 일수
+
+
+# 행 출력 포맷은 모듈 로드 시 한 번만 조립합니다 - 루프 안에서 행마다
+# 같은 색상 이스케이프 시퀀스와 폭 지정자를 다시 이어붙이지 않도록.
+_ROW_FIELDS = ("{symbol:<10} {timeframe:<5} {calmar:>8.2f} {ret_cagr:>14} "
+               "{mdd:>7.1f}% {trades:>14} {win:>7.1f}% {pf:>6.2f} "
+               "{sharpe:>8.2f}")
+_FMT_POS = "     " + Fore.GREEN + _ROW_FIELDS + Style.RESET_ALL
+_FMT_NEG = "     " + Fore.RED + _ROW_FIELDS + Style.RESET_ALL
 
 
 def print_comparison_table(all_results):
-    """여러 백테스트 결과를 비교 테이블로 출력합니다."""
+    """여러 백테스트 결과를 비교 테이블로 출력합니다.
+
+    파생 지표(Calmar/CAGR/월평균 거래수)는 행마다 파이썬 함수를 부르지
+    않고 DataFrame 컬럼 연산으로 한 번에 계산합니다 - 기간 문자열 파싱도
+    행별 strptime 대신 벡터화된 to_datetime 한 번으로 끝납니다.
+    """
     print(f"\n{Fore.CYAN}{Style.BRIGHT}=== 백테스트 결과 비교 ==={Style.RESET_ALL}")
-    
+
     if not all_results:
         print("❌ 결과가 없습니다.")
         return
-    
-    # 오류가 없는 결과만 필터링하고 종목명으로 정렬
+
+    # 오류가 없는 결과만 필터링
     valid_results = [r for r in all_results if 'error' not in r]
-    valid_results.sort(key=lambda x: x.get('symbol', ''))
-    
+
     # 전략 이름 출력
     if all_results and len(all_results) > 0:
         first_result = all_results[0]
@@ -649,8 +1006,7 @@ def print_comparison_table(all_results):
         else:
             # strategy가 없는 경우 config에서 직접 가져오기
             try:
-                with open("config/main_config.yaml", 'r', encoding='utf-8') as f:
-                    config_from_file = yaml.safe_load(f)
+                config_from_file = load_main_config()
                 strategy = config_from_file['simple_backtest']['strategy']
                 print(f"{Fore.CYAN}📊 전략: {strategy}{Style.RESET_ALL}")
             except Exception:
@@ -664,8 +1020,7 @@ def print_comparison_table(all_results):
         else:
             # period가 없는 경우 config에서 직접 가져오기
             try:
-                with open("config/main_config.yaml", 'r', encoding='utf-8') as f:
-                    config_from_file = yaml.safe_load(f)
+                config_from_file = load_main_config()
                 start_date = config_from_file['common']['start_date']
                 end_date = config_from_file['common']['end_date']
                 print(f"{Fore.CYAN}📅 백테스트 기간: {start_date} ~ {end_date}{Style.RESET_ALL}")
@@ -673,40 +1028,67 @@ def print_comparison_table(all_results):
                 pass
     
     print()  # 빈 줄 추가
-    
+
     # 헤더 출력 (컬럼 너비 최적화 + 오른쪽으로 5칸 이동)
     print(f"     {Fore.YELLOW}{Style.BRIGHT}{'Symbol':<10} {'TF':<5} {'Calmar':>8} {'Return% (CAGR)':>15} {'MDD%':>7} {'Trades(월평균)':>15} {'Win%':>7} {'PF':>6} {'Sharpe':>8}{Style.RESET_ALL}")
     print("     " + "=" * 100)
-    
-    # 각 결과 출력
-    for result in valid_results:
-        # 정상 결과 (None 값 안전 처리)
-        symbol = result.get('symbol', 'N/A')
-        timeframe = result.get('timeframe', 'N/A')
-        return_pct = result.get('total_return_pct', 0) or 0
-        sharpe = result.get('sharpe_ratio', 0) or 0
-        mdd = result.get('max_drawdown_pct', 0) or 0
-        trades = result.get('total_trades', 0) or 0
-        win_rate = result.get('win_rate_pct', 0) or 0
-        profit_factor = result.get('profit_factor', 0) or 0
-        
-        # Calmar Ratio 계산 (수익률 / 최대낙폭) - 안전 처리
-        calmar_ratio = (return_pct / abs(mdd)) if mdd and mdd != 0 else 0
-        
-        # 색상 결정
-        color = Fore.GREEN if return_pct and return_pct > 0 else Fore.RED
-        
-        # CAGR(연복리 수익률) 계산
-        cagr = calculate_cagr(return_pct, result.get('period', ''))
-        
-        # 월평균 거래수 계산
-        monthly_trades = calculate_monthly_trades(trades, result.get('period', ''))
-        
-        # 가독성 향상을 위한 포맷팅 (총수익률(CAGR) 형태, 총거래수(월거래수) 형태)
-        return_cagr_display = f"{return_pct:.1f}({cagr:.1f})"
-        trades_display = f"{trades:.0f}({monthly_trades:.2f})"
-        print(f"     {color}{symbol:<10} {timeframe:<5} {calmar_ratio:>8.2f} {return_cagr_display:>14} {mdd:>7.1f}% {trades_display:>14} {win_rate:>7.1f}% {profit_factor:>6.2f} {sharpe:>8.2f}{Style.RESET_ALL}")
-    
+
+    if valid_results:
+        # 파생 지표를 컬럼 단위로 일괄 계산
+        df = pd.DataFrame(valid_results)
+        for col in ('total_return_pct', 'sharpe_ratio', 'max_drawdown_pct',
+                    'total_trades', 'win_rate_pct', 'profit_factor'):
+            if col in df:
+                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
+            else:
+                df[col] = 0.0
+        if 'symbol' not in df:
+            df['symbol'] = 'N/A'
+        if 'timeframe' not in df:
+            df['timeframe'] = 'N/A'
+        df = df.sort_values('symbol')
+
+        # 기간 문자열을 한 번에 파싱해 연/월 단위 길이 계산
+        if 'period' in df:
+            parts = df['period'].astype(str).str.split('~', n=1, expand=True)
+            start = pd.to_datetime(parts[0].str.strip(), errors='coerce')
+            if parts.shape[1] > 1:
+                end = pd.to_datetime(parts[1].str.strip(), errors='coerce')
+            else:
+                end = start  # '~'가 없는 기간 문자열
+            days = (end - start).dt.days
+        else:
+            days = pd.Series(0, index=df.index)
+        years = days / 365.25
+        months = days / 30.44  # 평균 월 일수
+
+        ret = df['total_return_pct']
+        # CAGR: (1 + 수익률)^(1/년수) - 1. 기간을 모르면 원 수익률 그대로.
+        cagr = ((1 + ret / 100).pow(1 / years.where(years > 0)) - 1) * 100
+        df['cagr'] = cagr.fillna(ret)
+        df['monthly_trades'] = (df['total_trades'] / months.where(months > 0)
+                                ).fillna(df['total_trades'])
+        mdd_abs = df['max_drawdown_pct'].abs()
+        df['calmar'] = (ret / mdd_abs.where(mdd_abs > 0)).fillna(0.0)
+
+        # 각 결과 출력 (색상별로 미리 조립된 포맷 문자열 사용)
+        for result in df.to_dict('records'):
+            return_pct = result['total_return_pct']
+            fmt = _FMT_POS if return_pct > 0 else _FMT_NEG
+
+            # 가독성 향상을 위한 포맷팅 (총수익률(CAGR), 총거래수(월거래수))
+            print(fmt.format(
+                symbol=result['symbol'],
+                timeframe=result['timeframe'],
+                calmar=result['calmar'],
+                ret_cagr=f"{return_pct:.1f}({result['cagr']:.1f})",
+                mdd=result['max_drawdown_pct'],
+                trades=(f"{result['total_trades']:.0f}"
+                        f"({result['monthly_trades']:.2f})"),
+                win=result['win_rate_pct'],
+                pf=result['profit_factor'],
+                sharpe=result['sharpe_ratio']))
+
     # 오류가 있는 결과도 표시
     error_results = [r for r in all_results if 'error' in r]
     if error_results:
@@ -720,35 +1102,123 @@ def print_comparison_table(all_results):
 
 
 
+def _parse_args(argv=None):
+    """CLI 인자를 파싱합니다. 인자를 주면 해당 프롬프트를 건너뜁니다.
+
+    CI/야간 스윕처럼 무인으로 돌릴 때 input() 대기가 없도록
+    예: run_simple_backtest.py --symbols BTCUSDT,ETHUSDT --timeframes 1h,4h
+        --strategy SmaCrossStrategy --start 2024-01-01 --end 2025-01-01
+    """
+    parser = argparse.ArgumentParser(
+        description="Backtrader-V3 백테스트 러너 "
+                    "(인자 없이 실행하면 기존 대화형 모드)")
+    parser.add_argument('--config-mode', choices=['1', '2'],
+                        help="1=config 파일 사용, 2=수동 설정")
+    parser.add_argument('--symbols',
+                        help="쉼표로 구분한 종목 목록 또는 'all'")
+    parser.add_argument('--timeframes',
+                        help="쉼표로 구분한 타임프레임 목록 또는 'all'")
+    parser.add_argument('--strategy', help="전략 클래스 이름")
+    parser.add_argument('--start', help="시작일 (YYYY-MM-DD)")
+    parser.add_argument('--end', help="종료일 (YYYY-MM-DD)")
+    parser.add_argument('--days', type=int, help="최근 N일만 백테스트")
+    return parser.parse_args(argv)
+
+
+def _resolve_multi(spec, available, label):
+    """쉼표 구분 목록/'all' CLI 인자를 검증해 리스트로 반환합니다."""
+    if spec.strip().lower() == 'all':
+        return list(available)
+    chosen = [s.strip() for s in spec.split(',') if s.strip()]
+    unknown = [s for s in chosen if s not in available]
+    if unknown:
+        print(f"❌ 사용할 수 없는 {label}: {', '.join(unknown)}")
+        sys.exit(1)
+    return chosen
+
+
+def _period_from_args(args):
+    """CLI 인자에서 기간 설정 dict를 만듭니다 (없으면 None)."""
+    if args.start and args.end:
+        for date_str in (args.start, args.end):
+            try:
+                datetime.fromisoformat(date_str)
+            except ValueError:
+                print(f"❌ 올바른 날짜 형식이 아닙니다: {date_str} (YYYY-MM-DD)")
+                sys.exit(1)
+        return {'type': 'custom_period',
+                'start_date': args.start, 'end_date': args.end}
+    if args.days:
+        return {'type': 'recent_days', 'days': args.days}
+    return None
+
+
 def main():
-    # colorama 초기화
-    init(autoreset=True)
-    
+    args = _parse_args()
+
+    # 진단 로그 레벨 설정 (LOGLEVEL=DEBUG로 실행하면 워커 진단 출력 활성화)
+    logging.basicConfig(
+        level=os.environ.get('LOGLEVEL', 'INFO').upper(),
+        format='%(levelname)s %(name)s: %(message)s')
+
+    # colorama 초기화 - 파이프/로그로 리다이렉트된 출력에는 이스케이프
+    # 시퀀스를 아예 쓰지 않도록 tty가 아니면 strip
+    init(autoreset=True, strip=not sys.stdout.isatty())
+
     print("🚀 Backtrader-V3 대화형 백테스트 시스템")
     print("=" * 50)
-    
-    # 1. 설정 모드 선택
-    mode = select_config_mode()
-    
+
+    # 1. 설정 모드 선택 - 수동 설정용 인자가 하나라도 있으면 모드 2로 간주
+    manual_args = (args.symbols or args.timeframes or args.strategy
+                   or args.start or args.days)
+    if args.config_mode:
+        mode = args.config_mode
+    elif manual_args:
+        mode = '2'
+    else:
+        mode = select_config_mode()
+
     if mode == '1':
         # config 파일 사용
-        config = run_backtest_with_config()
+        configs = run_backtest_with_config()
     else:
-        # 수동 설정
-        selected_strategy = select_strategy()
-        symbols = select_symbols()
-        timeframes = select_timeframes()
-        period_config = select_backtest_period()
-        configs = run_backtest_manual(symbols, timeframes, period_config, selected_strategy)
-    
+        # 수동 설정 - CLI로 받은 항목은 프롬프트 없이 검증만 수행
+        if args.strategy:
+            selected_strategy = args.strategy
+            if selected_strategy not in get_available_strategies():
+                print(f"❌ 사용할 수 없는 전략: {selected_strategy}")
+                sys.exit(1)
+        else:
+            selected_strategy = select_strategy()
+
+        if args.symbols:
+            symbols = _resolve_multi(args.symbols, get_available_symbols(),
+                                     "종목")
+        else:
+            symbols = select_symbols()
+
+        if args.timeframes:
+            timeframes = _resolve_multi(args.timeframes,
+                                        get_available_timeframes(),
+                                        "타임프레임")
+        else:
+            timeframes = select_timeframes()
+
+        period_config = _period_from_args(args)
+        if period_config is None:
+            # 기간 인자가 없으면: 무인 실행이면 config 기본값, 아니면 프롬프트
+            period_config = ({'type': 'default'} if manual_args
+                             else select_backtest_period())
+
+        configs = run_backtest_manual(symbols, timeframes, period_config,
+                                      selected_strategy)
+
     # 2. 백테스트 실행
-    if mode == '1':
-        execute_backtest(config)
-    else:
-        execute_backtest(configs)
-    
+    execute_backtest(configs)
+
     print(f"\n{Fore.GREEN}✅ 백테스트가 완료되었습니다!{Style.RESET_ALL}")
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
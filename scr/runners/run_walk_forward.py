@@ -1,54 +1,416 @@
 import yaml
 import os
+import json
+import pickle
+import hashlib
+import argparse
+import functools
+import itertools
+import multiprocessing
+import concurrent.futures
+from multiprocessing import shared_memory
+import numpy as np
 import pandas as pd
-from datetime import timedelta
-from ..core.data import DataFactory
+from tqdm import tqdm
+import backtrader as bt
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from ..core.data import _load_ohlcv, NumpyArrayData, df_to_arrays
 from ..core.engine import BacktestEngine
 from ..core import strategies
 
-def run_single_wfa_cycle(config, full_data, train_start, train_end, test_start, test_end):
-    """워크포워드 분석의 단일 사이클(훈련 -> 검증)을 실행합니다."""
+
+def _slice_bounds(index, start, end):
+    """정렬된 DatetimeIndex에서 [start, end] 구간의 정수 경계를 구합니다.
+
+    .loc 라벨 슬라이싱의 해싱/캘린더 오버헤드 없이 int64 ns 배열에 대한
+    np.searchsorted 이진 탐색 두 번으로 끝나고, iloc[lo:hi]는 O(1) 뷰를
+    돌려줍니다.
+    """
+    idx_ns = index.asi8
+    lo = np.searchsorted(idx_ns, pd.Timestamp(start).value, side='left')
+    hi = np.searchsorted(idx_ns, pd.Timestamp(end).value, side='right')
+    return int(lo), int(hi)
+
+
+def _load_full_df(common_cfg):
+    """WFA 대상 전체 기간의 OHLCV DataFrame을 로드합니다.
+
+    피드 객체가 아닌 원본 DataFrame이 필요하므로 scr.core.data의 로더를
+    재사용합니다 - CSV 파싱 결과가 zstd Parquet 사이드카로 캐시돼 재실행과
+    풀 워커 초기화가 컬럼 지향 파일에서 바로 읽습니다.
+    """
+    full_df = _load_ohlcv('data/ohlcv', 'data/cache',
+                          common_cfg['symbol'], common_cfg['timeframe'])
+    lo, hi = _slice_bounds(full_df.index,
+                           common_cfg['start_date'], common_cfg['end_date'])
+    # OHLCV 가격/거래량에는 float32 정밀도로 충분 - 사이클마다 복사되는
+    # 슬라이스와 공유 메모리 블록의 RAM/대역폭이 절반으로 줄어듭니다.
+    return full_df.iloc[lo:hi].astype(np.float32)
+
+
+def _expand_grid(params_to_optimize):
+    """그리드를 (파라미터 이름 튜플, 값 리스트들)로 전개합니다.
+
+    add_optimizer와 동일하게 숫자 3개짜리 리스트는 range(start, stop, step)
+    으로 해석하고, 스칼라는 단일 후보로 감쌉니다.
+    """
+    names = tuple(params_to_optimize)
+    values = []
+    for v in params_to_optimize.values():
+        if isinstance(v, list) and len(v) == 3:
+            values.append(list(range(*v)))
+        elif isinstance(v, (list, tuple)):
+            values.append(list(v))
+        else:
+            values.append([v])
+    return names, values
+
+
+# full_df 전체를 SoA 배열로 변환한 결과 (프로세스당 하나).
+# 사이클마다 피드용 변환(datetime의 파이썬 루프 O(N))을 반복하는 대신
+# 한 번만 변환해 두고 구간 뷰만 잘라 NumpyArrayData(arrays=...)에 넘깁니다.
+_feed_arrays_cache = {}
+
+
+def _full_arrays(full_data):
+    key = id(full_data)
+    cached = _feed_arrays_cache.get(key)
+    if cached is None:
+        _feed_arrays_cache.clear()  # 프로세스당 full_df는 하나뿐
+        cached = _feed_arrays_cache[key] = df_to_arrays(full_data)
+    return cached
+
+
+def _arrays_feed(arrays, lo, hi):
+    """마스터 배열의 [lo:hi) 뷰로 피드를 만듭니다 (복사/재변환 없음)."""
+    return NumpyArrayData(arrays=tuple(a[lo:hi] for a in arrays))
+
+
+# _run_and_analyze가 참조하는 실행당 불변 상태 (data/config는 해시 불가라
+# 캐시 키로 쓸 수 없으므로 모듈 상태로 둡니다).
+_memo_state = {}
+
+
+@functools.lru_cache(maxsize=200_000)
+def _run_and_analyze(params_tuple, lo, hi):
+    """단일 파라미터 조합을 훈련 구간 [lo:hi)에서 백테스트해 분석 dict를 반환합니다.
+
+    슬라이딩 윈도우는 train_delta >> test_delta라 인접 사이클의 훈련 구간이
+    크게 겹치고, 같은 (파라미터, 훈련 구간) 평가가 반복될 수 있으므로
+    결과를 lru_cache로 메모이즈합니다. 구간은 미리 계산된 정수 경계라
+    캐시 키 해싱도 싸게 끝납니다.
+    """
+    engine = BacktestEngine(_memo_state['config'], maxcpus=1)
+    engine.add_data(_arrays_feed(_memo_state['arrays'], lo, hi))
+    engine.add_strategy(_memo_state['strategy_class'], dict(params_tuple))
+    result = engine.run()
+    analysis = engine.analyze_results(result[0])
+    analysis['params'] = dict(params_tuple)
+    return analysis
+
+
+def run_single_wfa_cycle(config, full_data, cycle_spec, strategy_class,
+                         maxcpus=None):
+    """워크포워드 분석의 단일 사이클(훈련 -> 검증)을 실행합니다.
+
+    cycle_spec은 _build_cycle_specs가 만든 (타임스탬프 4개 + 정수 경계 4개)
+    튜플입니다. 구간 슬라이스는 미리 계산된 정수 경계의 iloc 뷰(O(1))로만
+    수행합니다. 사이클 단위로 프로세스 풀에서 병렬 실행될 수 있으므로,
+    워커에서는 maxcpus=1로 호출해 backtrader의 내부 최적화 풀이 중첩되지
+    않게 합니다.
+    """
+    (train_start, train_end, _test_start, _test_end,
+     lo_train, hi_train, lo_test, hi_test) = cycle_spec
+    # 사이클마다 반복되는 dict 체인 조회는 지역 변수로 한 번만
     wf_cfg = config['walk_forward']
-    strategy_class = getattr(strategies, wf_cfg['strategy'])
-    
-    # 1. 훈련(Optimization) 단계
-    train_data = full_data.loc[train_start:train_end]
-    train_feed = bt.feeds.PandasData(dataname=train_data)
-    
-    opt_engine = BacktestEngine(config)
-    opt_engine.add_data(train_feed)
-    opt_engine.add_optimizer(strategy_class, wf_cfg['params_to_optimize'])
-    opt_results = opt_engine.run()
-
-    # 훈련 결과에서 최적 파라미터 찾기
-    final_results = []
-    for run in opt_results:
-        analysis = opt_engine.analyze_results(run[0])
-        analysis['params'] = run[0].params.__dict__
-        final_results.append(analysis)
-    
-    if not final_results:
+    optimize_target = wf_cfg['optimize_target']
+    params_to_optimize = wf_cfg['params_to_optimize']
+    arrays = _full_arrays(full_data)
+
+    if wf_cfg.get('search') == 'bayesian':
+        # 베이지안 탐색: 전수 그리드 대신 Optuna TPE로 유망 조합만 평가하고
+        # patience 회 연속 미갱신 시 조기 종료 - 가망 없는 조합을 건너뜀
+        train_engine = BacktestEngine(
+            {**config,
+             'optimization': {**(config.get('optimization') or {}),
+                              'optimize_target': optimize_target}},
+            maxcpus=1)
+        train_engine.add_data(_arrays_feed(arrays, lo_train, hi_train))
+        bayes_results = train_engine.run_bayesian(
+            strategy_class, params_to_optimize,
+            n_trials=wf_cfg.get('n_trials', 50),
+            patience=wf_cfg.get('patience', 10))
+        # run_bayesian은 목표값 내림차순으로 정렬해 반환
+        best_run = bayes_results[0] if bayes_results else None
+    else:
+        # 그리드 탐색(기본) - optstrategy 대신 조합을 명시적으로 전개해
+        # 조합별 결과를 (파라미터, 훈련 구간) 키로 메모이즈.
+        # 최고 결과 하나만 필요하므로 전체 분석 리스트를 만들지 않고
+        # 제너레이터를 max로 단일 패스 리듀스 (조합 수만큼의 리스트 생략)
+        _memo_state['config'] = config
+        _memo_state['arrays'] = arrays
+        _memo_state['strategy_class'] = strategy_class
+
+        param_names, value_lists = _expand_grid(params_to_optimize)
+        best_run = max(
+            (_run_and_analyze(tuple(zip(param_names, combo)),
+                              lo_train, hi_train)
+             for combo in itertools.product(*value_lists)),
+            key=lambda x: x[optimize_target], default=None)
+
+    if best_run is None:
         print(f"Warning: Optimization failed for period {train_start} to {train_end}. Skipping.")
         return None
 
-    best_run = sorted(final_results, key=lambda x: x[wf_cfg['optimize_target']], reverse=True)[0]
     best_params = best_run['params']
 
-    # 2. 검증(Out-of-Sample Test) 단계
-    test_data = full_data.loc[test_start:test_end]
-    test_feed = bt.feeds.PandasData(dataname=test_data)
-    
-    test_engine = BacktestEngine(config)
+    # 2. 검증(Out-of-Sample Test) 단계 - 같은 마스터 배열의 다른 구간 뷰
+    test_feed = _arrays_feed(arrays, lo_test, hi_test)
+
+    test_engine = BacktestEngine(config, maxcpus=maxcpus)
     test_engine.add_data(test_feed)
     test_engine.add_strategy(strategy_class, best_params)
     test_results = test_engine.run()
-    
+
     oos_analysis = test_engine.analyze_results(test_results[0])
     oos_analysis['best_params'] = best_params
     return oos_analysis
 
 
+# OOS 분석 결과의 디스크 캐시 - (설정, 데이터, 구간)이 같으면 결과가
+# 결정적이므로, 설정 일부만 바꿔 재실행할 때 변하지 않은 사이클은
+# 최적화/백테스트를 통째로 건너뜁니다.
+_CACHE_DIR = "results/cache/wfa"
+
+
+def _data_sha(common_cfg):
+    """데이터 파일의 (경로, 크기, 수정 시각) 해시를 반환합니다.
+
+    내용 전체를 읽지 않고도 파일이 바뀌면 키가 바뀌도록 하는 용도입니다.
+    """
+    filepath = f"data/ohlcv/{common_cfg['symbol']}_{common_cfg['timeframe']}.csv"
+    try:
+        st = os.stat(filepath)
+        token = f"{filepath}:{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        token = filepath
+    return hashlib.blake2b(token.encode()).hexdigest()
+
+
+def _cycle_cache_key(wf_cfg, data_sha, cycle_spec):
+    train_start, train_end, test_start, test_end = cycle_spec[:4]
+    payload = json.dumps(
+        {'cfg': wf_cfg, 'data_sha': data_sha,
+         'tr': (str(train_start), str(train_end)),
+         'te': (str(test_start), str(test_end))},
+        sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+def _cache_get(key):
+    try:
+        with open(os.path.join(_CACHE_DIR, f"{key}.pkl"), 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _cache_put(key, value):
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(_CACHE_DIR, f"{key}.pkl"), 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # 캐시 실패는 결과에 영향 없음
+
+
+def _run_cycle_cached(config, full_data, cycle_spec, strategy_class,
+                      data_sha, use_cache, maxcpus=None):
+    """디스크 캐시를 먼저 확인하고, 미스일 때만 사이클을 실제로 실행합니다."""
+    if not use_cache:
+        return run_single_wfa_cycle(config, full_data, cycle_spec,
+                                    strategy_class, maxcpus=maxcpus)
+    key = _cycle_cache_key(config['walk_forward'], data_sha, cycle_spec)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    result = run_single_wfa_cycle(config, full_data, cycle_spec,
+                                  strategy_class, maxcpus=maxcpus)
+    if result is not None:
+        _cache_put(key, result)
+    return result
+
+
+def _stage_shared_df(full_df):
+    """full_df의 컬럼/인덱스를 공유 메모리 블록 2개에 올립니다.
+
+    워커가 DataFrame을 각자 디스크에서 다시 읽는 대신 같은 RAM에 대한
+    제로카피 뷰를 재구성하도록 (스펙 dict, 부모가 해제할 핸들 리스트)를
+    반환합니다. 실패하면 (None, [])를 돌려주고 워커가 직접 로드합니다.
+    """
+    try:
+        data = np.ascontiguousarray(full_df.to_numpy().T)
+        index_ns = full_df.index.asi8
+        shm_data = shared_memory.SharedMemory(create=True, size=data.nbytes)
+        np.ndarray(data.shape, dtype=data.dtype, buffer=shm_data.buf)[:] = data
+        shm_index = shared_memory.SharedMemory(create=True,
+                                               size=index_ns.nbytes)
+        np.ndarray(index_ns.shape, dtype=np.int64,
+                   buffer=shm_index.buf)[:] = index_ns
+    except Exception:
+        return None, []
+    spec = {'data_name': shm_data.name, 'index_name': shm_index.name,
+            'shape': data.shape, 'dtype': data.dtype.str,
+            'columns': tuple(full_df.columns)}
+    return spec, [shm_data, shm_index]
+
+
+def _attach_shared_df(spec):
+    """부모가 올려 둔 공유 메모리 블록에서 DataFrame 뷰를 재구성합니다."""
+    shm_data = shared_memory.SharedMemory(name=spec['data_name'])
+    shm_index = shared_memory.SharedMemory(name=spec['index_name'])
+    data = np.ndarray(spec['shape'], dtype=np.dtype(spec['dtype']),
+                      buffer=shm_data.buf)
+    index_ns = np.ndarray((spec['shape'][1],), dtype=np.int64,
+                          buffer=shm_index.buf)
+    # 핸들이 GC되면 버퍼가 닫히므로 워커 수명 동안 참조를 유지
+    _worker_state['shm'] = (shm_data, shm_index)
+    return pd.DataFrame(data.T, index=pd.DatetimeIndex(index_ns),
+                        columns=list(spec['columns']), copy=False)
+
+
+# ProcessPoolExecutor 워커별 상태 (_worker_init이 각 워커에서 한 번 채움).
+# 사이클마다 DataFrame을 피클해 넘기지 않고 워커당 한 번만 준비합니다.
+_worker_state = {}
+
+
+def _worker_init(config, data_sha, use_cache, shm_spec=None):
+    _worker_state['config'] = config
+    _worker_state['data_sha'] = data_sha
+    _worker_state['use_cache'] = use_cache
+    # 전략 클래스 리플렉션은 사이클마다가 아니라 워커당 한 번만
+    _worker_state['strategy_class'] = getattr(
+        strategies, config['walk_forward']['strategy'])
+    if shm_spec is not None:
+        try:
+            _worker_state['full_df'] = _attach_shared_df(shm_spec)
+            return
+        except Exception:
+            pass  # 공유 메모리 접근 실패 - 직접 로드로 폴백
+    _worker_state['full_df'] = _load_full_df(config['common'])
+
+
+def _wfa_worker(cycle_spec):
+    """워커에서 단일 WFA 사이클을 실행합니다 (모듈 최상위 - 피클 가능)."""
+    return _run_cycle_cached(_worker_state['config'],
+                             _worker_state['full_df'],
+                             cycle_spec,
+                             _worker_state['strategy_class'],
+                             _worker_state['data_sha'],
+                             _worker_state['use_cache'], maxcpus=1)
+
+
+def _build_cycle_specs(full_df, wf_cfg):
+    """모든 사이클의 경계를 한 번에 벡터 연산으로 계산합니다.
+
+    사이클당 캘린더 연산/라벨 조회 대신 int64 ns 인덱스에 대한
+    np.searchsorted 네 번으로 (N, 4) 정수 경계 행렬을 만들고,
+    출력용 타임스탬프 4개와 함께 스펙 튜플로 묶어 돌려줍니다.
+    """
+    index_ns = full_df.index.asi8
+    day_ns = 86_400_000_000_000
+    train_ns = wf_cfg['train_period_days'] * day_ns
+    test_ns = wf_cfg['test_period_days'] * day_ns
+
+    span_ns = index_ns[-1] - index_ns[0] - train_ns - test_ns
+    if span_ns < 0:
+        return []
+    n_cycles = int(span_ns // test_ns) + 1
+
+    train_starts = index_ns[0] + test_ns * np.arange(n_cycles, dtype=np.int64)
+    train_ends = train_starts + train_ns
+    test_starts = train_ends + day_ns
+    test_ends = test_starts + test_ns
+
+    bounds = np.empty((n_cycles, 4), dtype=np.int64)
+    bounds[:, 0] = np.searchsorted(index_ns, train_starts, side='left')
+    bounds[:, 1] = np.searchsorted(index_ns, train_ends, side='right')
+    bounds[:, 2] = np.searchsorted(index_ns, test_starts, side='left')
+    bounds[:, 3] = np.searchsorted(index_ns, test_ends, side='right')
+
+    return [
+        (pd.Timestamp(train_starts[i]), pd.Timestamp(train_ends[i]),
+         pd.Timestamp(test_starts[i]), pd.Timestamp(test_ends[i]),
+         int(bounds[i, 0]), int(bounds[i, 1]),
+         int(bounds[i, 2]), int(bounds[i, 3]))
+        for i in range(n_cycles)
+    ]
+
+
+class WfaResultWriter:
+    """사이클 결과를 Parquet(+jsonl)로 행 단위 스트리밍 기록합니다.
+
+    마지막에 to_csv 한 번으로 쓰면 긴 WFA 실행이 도중에 죽었을 때 결과가
+    전부 사라지므로, 사이클이 끝날 때마다 zstd 압축 Parquet 로우그룹으로
+    내보내고 빠른 tail 확인용 jsonl도 한 줄씩 덧붙입니다.
+    pyarrow 미설치 시 Parquet은 조용히 건너뜁니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.jsonl_path = os.path.splitext(path)[0] + '.jsonl'
+        self._writer = None
+        self.enabled = pa is not None
+
+    def write(self, analysis):
+        row = {k: v for k, v in analysis.items() if not isinstance(v, dict)}
+        row['best_params'] = repr(analysis.get('best_params', {}))
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.jsonl_path, 'a') as f:
+                f.write(json.dumps(row, default=str) + '\n')
+        except OSError:
+            pass
+
+        if not self.enabled:
+            return
+        try:
+            batch = pa.RecordBatch.from_pydict({k: [v] for k, v in row.items()})
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, batch.schema,
+                                                compression='zstd')
+            self._writer.write_batch(batch)
+        except Exception as e:
+            # 결과 기록 실패가 분석 자체를 중단시키면 안 됨
+            print(f"Warning: Parquet 결과 기록 비활성화: {e}")
+            self.enabled = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            print(f"\nDetailed WFA results saved to {self.path}")
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='워크포워드 분석 실행')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='사이클 결과 디스크 캐시를 사용하지 않음')
+    return parser.parse_args(argv)
+
+
 def main():
+    args = _parse_args()
+    use_cache = not args.no_cache
+
     print("--- Running Walk-Forward Analysis ---")
 
     # 1. 설정 및 전체 데이터 로드
@@ -57,40 +419,59 @@ def main():
 
     common_cfg = config['common']
     wf_cfg = config['walk_forward']
-    
-    # DataFactory는 피드 객체를 반환하므로, 원본 DataFrame이 필요함
-    filepath = f"data/ohlcv/{common_cfg['symbol']}-{common_cfg['timeframe']}.csv"
-    full_df = pd.read_csv(filepath, index_col='Date', parse_dates=True)
-    full_df = full_df.loc[common_cfg['start_date']:common_cfg['end_date']]
-
-    # 2. 워크포워드 기간 설정
-    start_date = full_df.index[0]
-    end_date = full_df.index[-1]
-    train_delta = timedelta(days=wf_cfg['train_period_days'])
-    test_delta = timedelta(days=wf_cfg['test_period_days'])
-    
+
+    full_df = _load_full_df(common_cfg)
+    data_sha = _data_sha(common_cfg)
+    strategy_class = getattr(strategies, wf_cfg['strategy'])
+
+    # 2. 워크포워드 사이클 경계를 먼저 모두 계산
+    cycle_specs = _build_cycle_specs(full_df, wf_cfg)
+
+    results_path_cfg = config['results_path']
+    save_dir = os.path.join(results_path_cfg['base'],
+                            results_path_cfg['walk_forward'])
+    writer = WfaResultWriter(os.path.join(save_dir, "wfa_summary.parquet"))
+
     all_oos_results = []
-    
-    current_date = start_date
-    while current_date + train_delta + test_delta <= end_date:
-        train_start = current_date
-        train_end = current_date + train_delta
-        test_start = train_end + timedelta(days=1)
-        test_end = test_start + test_delta
-        
-        print(f"\n--- WFA Cycle: Train[{train_start.date()}:{train_end.date()}] -> Test[{test_start.date()}:{test_end.date()}] ---")
-        
-        cycle_result = run_single_wfa_cycle(config, full_df, train_start, train_end, test_start, test_end)
-        
-        if cycle_result:
-            all_oos_results.append(cycle_result)
-            print(f"  > OOS Result: Return={cycle_result['total_return_pct']:.2f}%, MDD={cycle_result['max_drawdown_pct']:.2f}%")
-            print(f"  > Best Params Found: {cycle_result['best_params']}")
-
-        # 다음 윈도우로 이동 (슬라이딩 윈도우)
-        current_date += test_delta
-
-    # 3. 최종 결과 집계
+
+    # 3. 사이클 실행 - 사이클 간에는 상태가 전혀 공유되지 않으므로
+    #    여러 개면 프로세스 풀로 병렬 실행 (제출 순서대로 결과 수집)
+    if len(cycle_specs) > 1:
+        max_workers = min(len(cycle_specs), os.cpu_count() or 1)
+        # 전체 데이터를 공유 메모리에 한 번만 올려 워커들이 제로카피로 공유
+        shm_spec, shm_handles = _stage_shared_df(full_df)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_worker_init,
+                    initargs=(config, data_sha, use_cache, shm_spec)) as ex:
+                # map의 정적 분배 대신 사이클별 future 제출 - 빨리 끝난
+                # 워커가 곧바로 다음 사이클을 가져가 꼬리 유휴를 줄임
+                futures = {ex.submit(_wfa_worker, spec): i
+                           for i, spec in enumerate(cycle_specs)}
+                cycle_results = [None] * len(cycle_specs)
+                for future in tqdm(concurrent.futures.as_completed(futures),
+                                   total=len(futures), desc="WFA 사이클"):
+                    cycle_results[futures[future]] = future.result()
+            # 보고는 완료 순서가 아닌 사이클 순서대로
+            for spec, cycle_result in zip(cycle_specs, cycle_results):
+                _report_cycle(spec, cycle_result, all_oos_results, writer)
+        finally:
+            writer.close()
+            for handle in shm_handles:
+                handle.close()
+                handle.unlink()
+    else:
+        try:
+            for spec in cycle_specs:
+                cycle_result = _run_cycle_cached(config, full_df, spec,
+                                                 strategy_class,
+                                                 data_sha, use_cache)
+                _report_cycle(spec, cycle_result, all_oos_results, writer)
+        finally:
+            writer.close()
+
+    # 4. 최종 결과 집계
     if not all_oos_results:
         print("Walk-forward analysis could not be completed.")
         return
@@ -98,18 +479,26 @@ def main():
     results_df = pd.DataFrame(all_oos_results)
     print("\n\n--- Walk-Forward Analysis Final Summary ---")
     print(f"Number of Out-of-Sample Periods: {len(results_df)}")
-    print("\n--- Average Performance ---")
-    print(results_df[['total_return_pct', 'sharpe_ratio', 'max_drawdown_pct', 'win_rate_pct']].mean())
-    print("\n--- Performance Standard Deviation ---")
-    print(results_df[['total_return_pct', 'sharpe_ratio', 'max_drawdown_pct', 'win_rate_pct']].std())
+    # mean/std를 각각 호출하면 DataFrame을 두 번 훑으므로 agg로 한 번에 계산
+    summary_cols = ['total_return_pct', 'sharpe_ratio',
+                    'max_drawdown_pct', 'win_rate_pct']
+    summary = results_df[summary_cols].agg(['mean', 'std'])
+    print("\n--- Performance (mean / std) ---")
+    print(summary)
 
-    # 결과 저장
-    results_path_cfg = config['results_path']
-    save_dir = os.path.join(results_path_cfg['base'], results_path_cfg['walk_forward'])
-    os.makedirs(save_dir, exist_ok=True)
-    results_df.to_csv(os.path.join(save_dir, "wfa_summary.csv"))
-    print(f"\nDetailed WFA results saved to {save_dir}/wfa_summary.csv")
+
+
+def _report_cycle(spec, cycle_result, all_oos_results, writer):
+    """사이클 결과를 출력하고 집계 리스트와 스트리밍 기록에 추가합니다."""
+    train_start, train_end, test_start, test_end = spec[:4]
+    print(f"\n--- WFA Cycle: Train[{train_start.date()}:{train_end.date()}] -> Test[{test_start.date()}:{test_end.date()}] ---")
+    if cycle_result:
+        all_oos_results.append(cycle_result)
+        writer.write(cycle_result)
+        print(f"  > OOS Result: Return={cycle_result['total_return_pct']:.2f}%, MDD={cycle_result['max_drawdown_pct']:.2f}%")
+        print(f"  > Best Params Found: {cycle_result['best_params']}")
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    main()